@@ -7,48 +7,71 @@ import boto3
 import json
 import sys
 import os
+import random
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from botocore.exceptions import ClientError
 from bedrock_agentcore_starter_toolkit import Runtime
 # config_manager is in the same directory
-from config_manager import config
+from config_manager import config, RETRY_CFG
+
+# Parallel DeleteObjects requests when emptying the S3 bucket (kept below RETRY_CFG's pool size)
+S3_DELETE_WORKERS = 16
+
+# Single session shared by every cleanup step
+_SESSION = boto3.Session()
+# boto3 sessions are not thread-safe, so client creation is serialized
+_SESSION_LOCK = threading.Lock()
+
+@lru_cache(maxsize=None)
+def _client(service_name):
+    """Return a cached client for the given service"""
+    with _SESSION_LOCK:
+        return _SESSION.client(service_name, config=RETRY_CFG)
+
+@lru_cache(maxsize=None)
+def _resource(service_name):
+    """Return a cached resource for the given service"""
+    with _SESSION_LOCK:
+        return _SESSION.resource(service_name, config=RETRY_CFG)
 
 def get_mcp_server_details():
     """Get details of the specific MCP server to cleanup"""
     try:
-        agentcore_client = boto3.client('bedrock-agentcore-control')
+        agentcore_client = _client('bedrock-agentcore-control')
         
-        # Find the specific MCP server
-        next_token = None
-        while True:
-            response = agentcore_client.list_agent_runtimes(
-                nextToken=next_token
-            ) if next_token else agentcore_client.list_agent_runtimes()
+        # Find the specific MCP server - the name match is evaluated by JMESPath on each page
+        paginator = agentcore_client.get_paginator('list_agent_runtimes')
+        matches = paginator.paginate(PaginationConfig={'PageSize': 100}).search(
+            f"agentRuntimes[?agentRuntimeName=='{config.mcp_server_name}']"
+        )
+        
+        for runtime in matches:
+            if runtime is None:
+                continue
             
-            for runtime in response.get('agentRuntimes', []):
-                if runtime['agentRuntimeName'] == config.mcp_server_name:
-                    # Get detailed runtime info
-                    try:
-                        runtime_details = agentcore_client.get_agent_runtime(
-                            agentRuntimeId=runtime['agentRuntimeId'],
-                            agentRuntimeVersion='1'
-                        )
-                    except agentcore_client.exceptions.ResourceNotFoundException:
-                        continue
-                    except Exception as e:
-                        logger.error("Error getting runtime details - skipping")
-                        continue
-                    
-                    return {
-                        'agent_runtime_id': runtime['agentRuntimeId'],
-                        'agent_arn': runtime['agentRuntimeArn'],
-                        'execution_role_arn': runtime_details['roleArn'],
-                        'execution_role_name': runtime_details['roleArn'].split('/')[-1],
-                        'auth_config': runtime_details.get('authorizerConfiguration', {})
-                    }
+            # Get detailed runtime info
+            try:
+                runtime_details = agentcore_client.get_agent_runtime(
+                    agentRuntimeId=runtime['agentRuntimeId'],
+                    agentRuntimeVersion='1'
+                )
+            except agentcore_client.exceptions.ResourceNotFoundException:
+                continue
+            except Exception as e:
+                print("⚠️ Error getting runtime details - skipping")
+                continue
             
-            if 'nextToken' not in response:
-                break
-            next_token = response['nextToken']
+            return {
+                'agent_runtime_id': runtime['agentRuntimeId'],
+                'agent_arn': runtime['agentRuntimeArn'],
+                'execution_role_arn': runtime_details['roleArn'],
+                'execution_role_name': runtime_details['roleArn'].split('/')[-1],
+                'auth_config': runtime_details.get('authorizerConfiguration', {})
+            }
         
         return None
         
@@ -65,7 +88,7 @@ def cleanup_agentcore_runtime(server_details):
             
         print(f"🔄 Cleaning up AgentCore runtime: {server_details['agent_runtime_id']}")
         
-        agentcore_client = boto3.client('bedrock-agentcore-control')
+        agentcore_client = _client('bedrock-agentcore-control')
         
         response = agentcore_client.delete_agent_runtime(
             agentRuntimeId=server_details['agent_runtime_id']
@@ -74,16 +97,20 @@ def cleanup_agentcore_runtime(server_details):
         status = response.get('status', 'UNKNOWN')
         print(f"✅ AgentCore runtime deletion initiated - Status: {status}")
         
-        # Wait for deletion to complete with exponential backoff
+        # Wait for deletion to complete with decorrelated jitter backoff
         print(f"⏳ Waiting for AgentCore runtime deletion to complete...")
         print(f"   This typically takes 3-5 minutes. Please wait...")
-        max_attempts = 20  # Reduced attempts
-        attempt = 0
+        base_delay = 5
+        max_delay = 15
+        timeout = 300
+        sleep_time = base_delay
+        start_time = time.monotonic()
+        elapsed = 0
+        last_reported = None
         
-        while attempt < max_attempts:
-            attempt += 1
-            # Exponential backoff: start with 5s, increase to 15s
-            sleep_time = min(5 + (attempt * 2), 15)
+        while elapsed < timeout:
+            # Each delay is drawn between the base and 3x the previous delay, capped at max_delay
+            sleep_time = min(max_delay, random.uniform(base_delay, sleep_time * 3)) # nosec
             time.sleep(sleep_time)
             
             try:
@@ -92,16 +119,24 @@ def cleanup_agentcore_runtime(server_details):
                     agentRuntimeId=server_details['agent_runtime_id'],
                     agentRuntimeVersion='1'
                 )
-                print(f"     Still deleting... ({attempt * 10}s elapsed)", end='\r', flush=True)
+                progress = "Still deleting..."
             except agentcore_client.exceptions.ResourceNotFoundException:
                 # Runtime not found - deletion complete
-                print(f"\n   ✅ AgentCore runtime deleted successfully (took {attempt * 10} seconds)")
+                elapsed = time.monotonic() - start_time
+                print(f"\n   ✅ AgentCore runtime deleted successfully (took {int(elapsed)} seconds)")
                 return True
             except Exception as e:
                 # Other errors - continue waiting
-                print(f"     Checking... ({attempt * 10}s elapsed)", end='\r', flush=True)
+                progress = "Checking..."
+            
+            # Only redraw the progress line when another 10 seconds have passed
+            elapsed = time.monotonic() - start_time
+            if int(elapsed) // 10 != last_reported:
+                last_reported = int(elapsed) // 10
+                sys.stdout.write(f"     {progress} ({int(elapsed)}s elapsed)\r")
+                sys.stdout.flush()
         
-        print(f"\n   ⚠️ Deletion verification timed out after {max_attempts * 10} seconds")
+        print(f"\n   ⚠️ Deletion verification timed out after {int(elapsed)} seconds")
         print(f"   The runtime may still be deleting in the background")
         return False
         
@@ -115,7 +150,7 @@ def cleanup_cognito_resources():
         print("🔄 Cleaning up Cognito resources...")
         
         # Get Cognito config from Secrets Manager
-        secrets_client = boto3.client('secretsmanager')
+        secrets_client = _client('secretsmanager')
         try:
             secret_response = secrets_client.get_secret_value(
                 SecretId=f'{config.mcp_server_name}/cognito/credentials'
@@ -123,7 +158,7 @@ def cleanup_cognito_resources():
             cognito_config = json.loads(secret_response['SecretString'])
             
             # Delete Cognito user pool
-            cognito_client = boto3.client('cognito-idp')
+            cognito_client = _client('cognito-idp')
             pool_id = cognito_config['pool_id']
             
             # Delete domain first
@@ -133,8 +168,10 @@ def cleanup_cognito_resources():
                     UserPoolId=pool_id
                 )
                 print(f"✅ Cognito domain deleted: {cognito_config['domain_prefix']}")
-            except:
-                pass
+            except ClientError as e:
+                # A missing domain is fine; anything else (e.g. throttling) must surface
+                if e.response['Error']['Code'] not in ('ResourceNotFoundException', 'InvalidParameterException'):
+                    raise
             
             # Delete user pool
             cognito_client.delete_user_pool(UserPoolId=pool_id)
@@ -151,39 +188,83 @@ def cleanup_dynamodb_tables():
     try:
         print("🔄 Cleaning up DynamoDB tables...")
         
-        dynamodb = boto3.resource('dynamodb')
+        dynamodb = _resource('dynamodb')
         tables_to_delete = [config.applicants_table, config.claims_table]
         
-        for table_name in tables_to_delete:
+        def delete_and_wait(table_name):
             try:
                 table = dynamodb.Table(table_name)
                 table.delete()
-                table.wait_until_not_exists()
+                # Poll more often than the default waiter (20s x 25) to notice completion sooner
+                table.wait_until_not_exists(WaiterConfig={'Delay': 5, 'MaxAttempts': 60})
                 print(f"✅ DynamoDB table deleted: {table_name}")
-            except:
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'ResourceNotFoundException':
+                    raise
                 print(f"ℹ️ Table not found: {table_name}")
+        
+        # Delete tables concurrently so the total wait is the slowest table, not the sum
+        with ThreadPoolExecutor(max_workers=len(tables_to_delete)) as executor:
+            list(executor.map(delete_and_wait, tables_to_delete))
                 
     except Exception as e:
         print(f"⚠️ Error cleaning up DynamoDB: {e}")
 
+def _delete_object_batch(s3, bucket_name, objects):
+    """Delete up to 1000 objects with a single DeleteObjects call"""
+    response = s3.delete_objects(
+        Bucket=bucket_name,
+        Delete={'Objects': objects, 'Quiet': True}
+    )
+    errors = response.get('Errors', [])
+    if errors:
+        print(f"⚠️ Failed to delete {len(errors)} objects from S3 bucket: {bucket_name}")
+    return len(objects) - len(errors)
+
 def cleanup_s3_bucket():
     """Delete S3 bucket and all objects"""
     try:
         print("🔄 Cleaning up S3 bucket...")
         
-        s3 = boto3.client('s3')
+        s3 = _client('s3')
         bucket_name = config.s3_bucket_name
         
         try:
-            # Delete all objects first
-            response = s3.list_objects_v2(Bucket=bucket_name)
-            if 'Contents' in response:
-                objects = [{'Key': obj['Key']} for obj in response['Contents']]
-                s3.delete_objects(
-                    Bucket=bucket_name,
-                    Delete={'Objects': objects}
-                )
-                print(f"✅ Deleted {len(objects)} objects from S3 bucket: {bucket_name}")
+            # Versioned buckets keep old versions and delete markers that also block delete_bucket
+            versioning = s3.get_bucket_versioning(Bucket=bucket_name).get('Status')
+            if versioning:
+                paginator = s3.get_paginator('list_object_versions')
+                objects = filter(None, paginator.paginate(Bucket=bucket_name).search(
+                    '[Versions, DeleteMarkers][].{Key: Key, VersionId: VersionId}'
+                ))
+            else:
+                # Stream bare keys; empty pages yield None and are dropped
+                paginator = s3.get_paginator('list_objects_v2')
+                keys = filter(None, paginator.paginate(Bucket=bucket_name).search('Contents[].Key'))
+                objects = ({'Key': key} for key in keys)
+            
+            # Delete all objects first, 1000 keys per request (the DeleteObjects maximum).
+            # Batches are independent, so they are fanned out to a bounded worker pool;
+            # the semaphore caps how many pending batches are held in memory.
+            in_flight = threading.BoundedSemaphore(S3_DELETE_WORKERS * 2)
+            futures = []
+            
+            def submit_batch(executor, batch):
+                in_flight.acquire()
+                future = executor.submit(_delete_object_batch, s3, bucket_name, batch)
+                future.add_done_callback(lambda _: in_flight.release())
+                futures.append(future)
+            
+            with ThreadPoolExecutor(max_workers=S3_DELETE_WORKERS) as executor:
+                while True:
+                    batch = list(islice(objects, 1000))
+                    if not batch:
+                        break
+                    submit_batch(executor, batch)
+            
+            deleted = sum(future.result() for future in futures)
+            if deleted:
+                print(f"✅ Deleted {deleted} objects from S3 bucket: {bucket_name}")
             
             # Delete bucket
             s3.delete_bucket(Bucket=bucket_name)
@@ -204,32 +285,46 @@ def cleanup_iam_role(server_details):
             
         print(f"🔄 Cleaning up IAM role: {server_details['execution_role_name']}")
         
-        iam = boto3.client('iam')
+        iam = _client('iam')
         role_name = server_details['execution_role_name']
         
-        # Remove all inline policies
+        # Collect inline and managed policies; removals are independent so they run concurrently
+        policy_tasks = []
         try:
             inline_policies = iam.list_role_policies(RoleName=role_name)
             for policy_name in inline_policies.get('PolicyNames', []):
-                iam.delete_role_policy(
-                    RoleName=role_name,
-                    PolicyName=policy_name
-                )
-                print(f"✅ Removed inline policy {policy_name}")
+                policy_tasks.append((
+                    iam.delete_role_policy,
+                    {'RoleName': role_name, 'PolicyName': policy_name},
+                    f"Removed inline policy {policy_name}"
+                ))
         except Exception as e:
-            print(f"⚠️ Error removing inline policies: {e}")
+            print(f"⚠️ Error listing inline policies: {e}")
         
-        # Detach all managed policies
         try:
             attached_policies = iam.list_attached_role_policies(RoleName=role_name)
             for policy in attached_policies.get('AttachedPolicies', []):
-                iam.detach_role_policy(
-                    RoleName=role_name,
-                    PolicyArn=policy['PolicyArn']
-                )
-                print(f"✅ Detached managed policy {policy['PolicyName']}")
+                policy_tasks.append((
+                    iam.detach_role_policy,
+                    {'RoleName': role_name, 'PolicyArn': policy['PolicyArn']},
+                    f"Detached managed policy {policy['PolicyName']}"
+                ))
         except Exception as e:
-            print(f"⚠️ Error detaching managed policies: {e}")
+            print(f"⚠️ Error listing managed policies: {e}")
+        
+        def remove_policy(task):
+            operation, params, message = task
+            try:
+                operation(**params)
+                print(f"✅ {message}")
+            except iam.exceptions.NoSuchEntityException:
+                print(f"ℹ️ Policy already removed: {params.get('PolicyName', params.get('PolicyArn'))}")
+            except Exception as e:
+                print(f"⚠️ Error removing policy: {e}")
+        
+        if policy_tasks:
+            with ThreadPoolExecutor(max_workers=min(8, len(policy_tasks))) as executor:
+                list(executor.map(remove_policy, policy_tasks))
         
         # Delete the role
         try:
@@ -250,7 +345,7 @@ def cleanup_secrets_manager():
     try:
         print("🔄 Cleaning up Secrets Manager...")
         
-        secrets_client = boto3.client('secretsmanager')
+        secrets_client = _client('secretsmanager')
         secret_name = f'{config.mcp_server_name}/cognito/credentials'
         
         try:
@@ -265,6 +360,11 @@ def cleanup_secrets_manager():
     except Exception as e:
         print(f"⚠️ Error cleaning up Secrets Manager: {e}")
 
+def _cleanup_cognito_then_secrets():
+    """Delete Cognito resources, then the secret that locates them"""
+    cleanup_cognito_resources()
+    cleanup_secrets_manager()
+
 def main():
     """Main cleanup function"""
     print("🗑️ NOVA LITE 2.0 ENTERPRISE CLEANUP")
@@ -316,10 +416,17 @@ def main():
         print(f"\n   AWS CLI command:")
         print(f"   aws iam delete-role --role-name {server_details['execution_role_name']}\n")
     
-    cleanup_cognito_resources()
-    cleanup_dynamodb_tables()
-    cleanup_s3_bucket()
-    cleanup_secrets_manager()
+    # Remaining resources are independent, except that Cognito cleanup reads the secret,
+    # so the secret is only deleted once Cognito cleanup has finished
+    independent_cleanups = [
+        _cleanup_cognito_then_secrets,
+        cleanup_dynamodb_tables,
+        cleanup_s3_bucket
+    ]
+    with ThreadPoolExecutor(max_workers=len(independent_cleanups)) as executor:
+        futures = [executor.submit(cleanup) for cleanup in independent_cleanups]
+        for future in futures:
+            future.result()
     
     print("")
     if runtime_deleted or not server_details:
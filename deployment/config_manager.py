@@ -4,11 +4,36 @@ Configuration manager Insurance Underwriting System
 """
 
 import yaml
+import json
 import os
+import hashlib
+import tempfile
 import sys
+import threading
 import boto3
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from botocore.config import Config
 from pathlib import Path
 
+# Prefer the libyaml C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Adaptive retries add client-side rate limiting on top of exponential backoff,
+# which keeps bursty create/delete traffic from turning throttles into failures.
+# The pool is sized for the threaded loaders (parallel uploads plus batch writers).
+RETRY_CFG = Config(
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    max_pool_connections=64,
+    tcp_keepalive=True
+)
+
+# GSI on the claims table so claim history is a query on applicant_id, not a scan
+CLAIMS_APPLICANT_INDEX = 'applicant_id-index'
+
 class EnterpriseConfig:
     def __init__(self, config_path=None):
         if config_path is None:
@@ -32,15 +57,24 @@ class EnterpriseConfig:
         self.config_path = config_path
         self.config = self._load_config()
         self.region = os.getenv('AWS_REGION', self.config.get('aws', {}).get('region', 'us-east-1'))
+        self._bucket_verified = False
     
     def _load_config(self):
-        """Load configuration from YAML file"""
+        """Load configuration from YAML file, reusing a parsed JSON sidecar when it is current"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f)
+            stat = os.stat(self.config_path)
+            cache_path = self._config_cache_path(self.config_path)
+            cached = self._read_config_cache(cache_path, stat)
+            if cached:
+                return cached
+            
+            # libyaml decodes UTF-8 itself, so hand it the raw bytes
+            with open(self.config_path, 'rb') as f:
+                config_data = yaml.load(f, Loader=_YamlLoader)
                 if not config_data:
                     raise ValueError("Configuration file is empty")
-                return config_data
+            self._write_config_cache(cache_path, stat, config_data)
+            return config_data
         except FileNotFoundError:
             print(f"❌ Error: Config file not found: {self.config_path}")
             print("Ensure config/enterprise_config.yaml exists and is properly configured")
@@ -51,56 +85,107 @@ class EnterpriseConfig:
         except Exception as e:
             print(f"❌ Error loading configuration: {e}")
             sys.exit(1)
+    
+    @staticmethod
+    def _config_cache_path(config_path):
+        """Sidecar location in the user cache dir, outside the Docker build context"""
+        home = os.path.expanduser('~')
+        if os.environ.get('XDG_CACHE_HOME'):
+            cache_root = os.environ['XDG_CACHE_HOME']
+        elif os.access(home, os.W_OK):
+            cache_root = os.path.join(home, '.cache')
+        else:
+            # Service users without a writable home (e.g. the runtime container)
+            cache_root = tempfile.gettempdir()
+        path_key = hashlib.sha256(os.path.abspath(config_path).encode('utf-8')).hexdigest()[:16]
+        return os.path.join(cache_root, 'insurance-underwriting', f'enterprise_config.{path_key}.json')
+    
+    @staticmethod
+    def _read_config_cache(cache_path, stat):
+        """Return the cached config if it was parsed from this exact YAML file version"""
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = json.load(f)
+            if cached.get('mtime_ns') == stat.st_mtime_ns and cached.get('size') == stat.st_size:
+                return cached.get('config')
+        except (OSError, ValueError, AttributeError):
+            pass
+        return None
+    
+    @staticmethod
+    def _write_config_cache(cache_path, stat, config_data):
+        """Write the parsed config to the cache dir (best effort, atomic replace)"""
+        try:
+            payload = json.dumps({'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'config': config_data})
+            # JSON stringifies non-string keys and turns tuples into lists; only cache exact round-trips
+            if json.loads(payload)['config'] != config_data:
+                return
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            # Unwritable cache dirs or non-JSON values (e.g. dates) just skip caching
+            pass
 
     
-    @property
+    @cached_property
     def applicants_table(self):
         return self.config['dynamodb']['applicants_table']
     
-    @property
+    @cached_property
     def claims_table(self):
         return self.config['dynamodb']['claims_table']
     
-    @property
+    @cached_property
+    def account_id(self):
+        """AWS account ID of the current credentials (resolved once)"""
+        sts = boto3.client('sts', region_name=self.region, config=RETRY_CFG)
+        return sts.get_caller_identity()['Account']
+    
+    @cached_property
     def s3_bucket_name(self):
         try:
             bucket_base = self.config['s3']['bucket_name']
             
             # Replace {account_id} placeholder with actual AWS account ID
             if '{account_id}' in bucket_base:
-                sts = boto3.client('sts', region_name=self.region)
-                account_id = sts.get_caller_identity()['Account']
-                bucket_base = bucket_base.replace('{account_id}', account_id)
+                bucket_base = bucket_base.replace('{account_id}', self.account_id)
             
             return f"{bucket_base}-{self.region}"
         except Exception as e:
             raise ValueError(f"Failed to construct S3 bucket name: {e}")
     
-    @property
+    @cached_property
     def medical_records_prefix(self):
         return self.config['s3']['medical_records_prefix']
     
-    @property
+    @cached_property
     def mcp_server_name(self):
         return self.config['agentcore']['mcp_server_name']
     
-    @property
+    @cached_property
     def runtime_role_name(self):
         return self.config['agentcore']['runtime_role_name']
     
-    @property
+    @cached_property
     def cognito_user_pool_name(self):
         return self.config['agentcore']['cognito_user_pool_name']
     
-    @property
+    @cached_property
     def oauth_api_identifier(self):
         return self.config['agentcore']['oauth_api_identifier']
     
-    @property
+    @cached_property
     def model_id(self):
         return self.config['nova']['model_id']
     
-    @property
+    @cached_property
     def inference_config(self):
         return self.config['nova']['inference_config']
     
@@ -118,42 +203,102 @@ class EnterpriseConfig:
     
     def _check_dynamodb_tables(self):
         """Check and create DynamoDB tables if needed"""
-        dynamodb = boto3.resource('dynamodb', region_name=self.region)
+        dynamodb = boto3.resource('dynamodb', region_name=self.region, config=RETRY_CFG)
         
         tables_to_check = [
-            (self.applicants_table, 'applicant_id'),
-            (self.claims_table, 'claim_id')
+            (self.applicants_table, 'applicant_id', None),
+            (self.claims_table, 'claim_id', (CLAIMS_APPLICANT_INDEX, 'applicant_id'))
         ]
         
-        for table_name, key_name in tables_to_check:
+        def describe_or_none(table_name):
             try:
-                table = dynamodb.Table(table_name)
-                table.load()
-                print(f"✅ DynamoDB table exists: {table_name}")
+                return dynamodb.meta.client.describe_table(TableName=table_name)['Table']
             except dynamodb.meta.client.exceptions.ResourceNotFoundException:
-                try:
-                    table = dynamodb.create_table(
-                        TableName=table_name,
-                        KeySchema=[{'AttributeName': key_name, 'KeyType': 'HASH'}],
-                        AttributeDefinitions=[{'AttributeName': key_name, 'AttributeType': 'S'}],
-                        BillingMode='PAY_PER_REQUEST'
-                    )
-                    table.wait_until_exists()
-                    print(f"✅ Created DynamoDB table: {table_name}")
-                except Exception as e:
-                    raise RuntimeError(f"Failed to create DynamoDB table: {type(e).__name__}")
+                return None
             except Exception as e:
                 raise RuntimeError(f"Failed to check DynamoDB table {table_name}: {e}")
+        
+        def create_and_wait(table_name, key_name, index=None):
+            try:
+                table_args = {
+                    'TableName': table_name,
+                    'KeySchema': [{'AttributeName': key_name, 'KeyType': 'HASH'}],
+                    'AttributeDefinitions': [{'AttributeName': key_name, 'AttributeType': 'S'}],
+                    'BillingMode': 'PAY_PER_REQUEST'
+                }
+                if index:
+                    index_name, index_key = index
+                    table_args['AttributeDefinitions'].append({'AttributeName': index_key, 'AttributeType': 'S'})
+                    table_args['GlobalSecondaryIndexes'] = [{
+                        'IndexName': index_name,
+                        'KeySchema': [{'AttributeName': index_key, 'KeyType': 'HASH'}],
+                        'Projection': {'ProjectionType': 'ALL'}
+                    }]
+                table = dynamodb.create_table(**table_args)
+                table.wait_until_exists()
+                print(f"✅ Created DynamoDB table: {table_name}")
+            except Exception as e:
+                raise RuntimeError(f"Failed to create DynamoDB table: {type(e).__name__}")
+        
+        def add_index(table_name, index):
+            # Tables created before the index was introduced get it added in place; DynamoDB
+            # backfills it in the background and queries fall back to a scan until it is active
+            index_name, index_key = index
+            try:
+                dynamodb.meta.client.update_table(
+                    TableName=table_name,
+                    AttributeDefinitions=[{'AttributeName': index_key, 'AttributeType': 'S'}],
+                    GlobalSecondaryIndexUpdates=[{
+                        'Create': {
+                            'IndexName': index_name,
+                            'KeySchema': [{'AttributeName': index_key, 'KeyType': 'HASH'}],
+                            'Projection': {'ProjectionType': 'ALL'}
+                        }
+                    }]
+                )
+                print(f"✅ Adding index {index_name} to DynamoDB table: {table_name}")
+            except Exception as e:
+                raise RuntimeError(f"Failed to add index {index_name} to {table_name}: {type(e).__name__}")
+        
+        # Describe all tables at once, then create and wait for the missing ones in parallel
+        with ThreadPoolExecutor(max_workers=len(tables_to_check)) as executor:
+            descriptions = list(executor.map(describe_or_none, [name for name, _, _ in tables_to_check]))
+            
+            missing_tables = []
+            missing_indexes = []
+            for table, description in zip(tables_to_check, descriptions):
+                table_name, _, index = table
+                if not description:
+                    missing_tables.append(table)
+                    continue
+                print(f"✅ DynamoDB table exists: {table_name}")
+                existing_indexes = {gsi['IndexName'] for gsi in description.get('GlobalSecondaryIndexes', [])}
+                if index and index[0] not in existing_indexes:
+                    missing_indexes.append((table_name, index))
+            
+            list(executor.map(lambda table: create_and_wait(*table), missing_tables))
+            list(executor.map(lambda entry: add_index(*entry), missing_indexes))
     
     def _check_s3_bucket(self):
         """Check and create S3 bucket if needed"""
-        s3 = boto3.client('s3', region_name=self.region)
+        if self._bucket_verified:
+            return
+        
+        s3 = boto3.client('s3', region_name=self.region, config=RETRY_CFG)
         
         try:
-            s3.head_bucket(Bucket=self.s3_bucket_name)
+            response = s3.head_bucket(Bucket=self.s3_bucket_name)
+            bucket_region = response['ResponseMetadata']['HTTPHeaders'].get('x-amz-bucket-region')
+            if bucket_region and bucket_region != self.region:
+                raise RuntimeError(f"S3 bucket exists in region {bucket_region}, expected {self.region}")
             print(f"✅ S3 bucket exists: {self.s3_bucket_name}")
+            self._bucket_verified = True
         except s3.exceptions.ClientError as e:
             error_code = e.response['Error']['Code']
+            # HEAD responses carry the bucket's real region even when the request fails
+            bucket_region = e.response.get('ResponseMetadata', {}).get('HTTPHeaders', {}).get('x-amz-bucket-region')
+            if error_code == '301' and bucket_region:
+                raise RuntimeError(f"S3 bucket exists in region {bucket_region}, expected {self.region}")
             if error_code in ['404', 'NoSuchBucket']:
                 # Bucket doesn't exist, create it
                 try:
@@ -165,6 +310,7 @@ class EnterpriseConfig:
                             CreateBucketConfiguration={'LocationConstraint': self.region}
                         )
                     print(f"✅ Created S3 bucket: {self.s3_bucket_name}")
+                    self._bucket_verified = True
                 except Exception as create_error:
                     raise RuntimeError(f"Failed to create S3 bucket: {type(create_error).__name__}")
             elif error_code == 'AccessDenied':
@@ -176,5 +322,27 @@ class EnterpriseConfig:
                 raise RuntimeError("Unexpected error checking S3 bucket configuration")
             raise
 
-# Global config instance
-config = EnterpriseConfig()
\ No newline at end of file
+@lru_cache(maxsize=None)
+def load(config_path=None):
+    """Return the EnterpriseConfig for a config file, parsing each file at most once per process"""
+    return EnterpriseConfig(config_path)
+
+class _LazyConfig:
+    """Proxy that builds the global EnterpriseConfig on first attribute access"""
+    
+    def __init__(self):
+        self._instance = None
+        self._lock = threading.Lock()
+    
+    def _get(self):
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = load()
+        return self._instance
+    
+    def __getattr__(self, name):
+        return getattr(self._get(), name)
+
+# Global config instance (YAML is only read when a setting is first used)
+config = _LazyConfig()
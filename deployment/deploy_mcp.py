@@ -5,14 +5,99 @@ Handles both full deployment and code updates
 """
 
 import boto3
+import contextlib
+import io
 import json
 import time
 import os
+import random
+import secrets
 import sys
 import argparse
-from boto3.session import Session
-from bedrock_agentcore_starter_toolkit import Runtime
-from config_manager import config
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from botocore.config import Config
+from botocore.exceptions import ClientError, WaiterError
+from config_manager import config, RETRY_CFG
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
+# Local record of runtime IDs by MCP server name, so redeploys can skip listing all runtimes
+RUNTIME_CACHE_FILE = '.agentcore_cache.json'
+
+# Generated docs live at the repo root, independent of the working directory
+_DOCS_DIR = Path(__file__).resolve().parent.parent / 'docs'
+
+# Single session shared by every deployment step
+_SESSION = boto3.Session()
+_REGION = _SESSION.region_name
+# boto3 sessions are not thread-safe, so client creation is serialized
+_SESSION_LOCK = threading.Lock()
+# Adaptive retries from config_manager, with bounded connect/read timeouts
+_BOTOCFG = RETRY_CFG.merge(Config(connect_timeout=5, read_timeout=30))
+
+@lru_cache(maxsize=None)
+def _client(service_name, region=None):
+    """Return a shared boto3 client per service/region (client creation parses service models)"""
+    with _SESSION_LOCK:
+        return _SESSION.client(service_name, region_name=region, config=_BOTOCFG)
+
+@lru_cache(maxsize=1)
+def _account_id():
+    """Return the caller's AWS account ID, looked up once per process"""
+    return _client('sts').get_caller_identity()['Account']
+
+def _dumps(obj):
+    """Serialize to a JSON string, using orjson when it is installed"""
+    return orjson.dumps(obj).decode() if orjson else json.dumps(obj)
+
+@lru_cache(maxsize=32)
+def _describe_runtime(agent_runtime_id, region):
+    """Fetch runtime details (role and authorizer), memoized per runtime ID"""
+    return _client('bedrock-agentcore-control', region).get_agent_runtime(
+        agentRuntimeId=agent_runtime_id,
+        agentRuntimeVersion='1'
+    )
+
+def _log_block(lines):
+    """Write a group of console lines with a single write instead of one print per line"""
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+@contextlib.contextmanager
+def _capture():
+    """Suppress verbose SDK output, replaying it to stderr if the block fails"""
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+            yield buf
+    except Exception:
+        sys.stderr.write(buf.getvalue())
+        raise
+
+def _load_runtime_cache():
+    """Load cached runtime IDs, or an empty mapping if there is no usable cache"""
+    try:
+        with open(RUNTIME_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def _save_runtime_cache(mcp_server_name, agent_runtime_id):
+    """Remember the runtime ID for an MCP server (best effort)"""
+    cache = _load_runtime_cache()
+    cache[mcp_server_name] = agent_runtime_id
+    try:
+        with open(RUNTIME_CACHE_FILE, 'w', encoding='utf-8') as f:
+            f.write(_dumps(cache))
+    except OSError:
+        pass
 
 def check_existing_mcp_server(mcp_server_name, region):
     """Check if MCP server exists in AgentCore"""
@@ -22,36 +107,50 @@ def check_existing_mcp_server(mcp_server_name, region):
     print(f"   Action: Querying Bedrock AgentCore for existing runtime")
     
     try:
-        agentcore_client = boto3.client('bedrock-agentcore-control', region_name=region)
+        agentcore_client = _client('bedrock-agentcore-control', region)
         
-        agent_runtime_id = None
-        agent_arn = None
-        next_token = None
-        
-        while True:
-            response = agentcore_client.list_agent_runtimes(nextToken=next_token) if next_token else agentcore_client.list_agent_runtimes()
+        # Warm path: go straight to the runtime ID remembered from a previous run
+        runtime_details = None
+        cached_runtime_id = _load_runtime_cache().get(mcp_server_name)
+        if cached_runtime_id:
+            try:
+                runtime_details = _describe_runtime(cached_runtime_id, region)
+                if runtime_details.get('agentRuntimeName') != mcp_server_name:
+                    runtime_details = None
+            except ClientError:
+                runtime_details = None
+        
+        if runtime_details:
+            agent_runtime_id = runtime_details['agentRuntimeId']
+            agent_arn = runtime_details['agentRuntimeArn']
+            print(f"   ✅ Found existing runtime: {agent_runtime_id} (cached)")
+        else:
+            # Stop paging as soon as the runtime is found
+            paginator = agentcore_client.get_paginator('list_agent_runtimes')
+            match = next(
+                (runtime
+                 for page in paginator.paginate(PaginationConfig={'PageSize': 100})
+                 for runtime in page.get('agentRuntimes', [])
+                 if runtime['agentRuntimeName'] == mcp_server_name),
+                None
+            )
             
-            for runtime in response.get('agentRuntimes', []):
-                if runtime['agentRuntimeName'] == mcp_server_name:
-                    agent_runtime_id = runtime['agentRuntimeId']
-                    agent_arn = runtime['agentRuntimeArn']
-                    break
+            if not match:
+                print(f"   Result: No existing MCP server found")
+                return None
             
-            if agent_runtime_id or 'nextToken' not in response:
-                break
-            next_token = response['nextToken']
-        
-        if not agent_runtime_id:
-            print(f"   Result: No existing MCP server found")
-            return None
-        
-        print(f"   ✅ Found existing runtime: {agent_runtime_id}")
-        print(f"   Fetching detailed configuration...")
-        
-        runtime_details = agentcore_client.get_agent_runtime(
-            agentRuntimeId=agent_runtime_id,
-            agentRuntimeVersion='1'
-        )
+            agent_runtime_id = match['agentRuntimeId']
+            agent_arn = match['agentRuntimeArn']
+            
+            print(f"   ✅ Found existing runtime: {agent_runtime_id}")
+            
+            # Newer list responses may already carry the role and authorizer; describe only if not
+            if 'roleArn' in match and 'authorizerConfiguration' in match:
+                runtime_details = match
+            else:
+                print(f"   Fetching detailed configuration...")
+                runtime_details = _describe_runtime(agent_runtime_id, region)
+            _save_runtime_cache(mcp_server_name, agent_runtime_id)
         
         execution_role_arn = runtime_details['roleArn']
         execution_role_name = execution_role_arn.split('/')[-1]
@@ -86,21 +185,28 @@ def check_existing_mcp_server(mcp_server_name, region):
 
 def setup_cognito_user_pool():
     """Setup Cognito for MCP server authentication"""
-    print(f"\n🔐 CREATING COGNITO AUTHENTICATION RESOURCES")
-    print(f"   Purpose: OAuth 2.0 authentication for MCP server")
-    print(f"   Grant Type: client_credentials (service-to-service)")
-    
-    boto_session = Session()
-    region = boto_session.region_name
-    cognito_client = boto3.client('cognito-idp', region_name=region)
-    secrets_client = boto3.client('secretsmanager', region_name=region)
+    _log_block([
+        f"\n🔐 CREATING COGNITO AUTHENTICATION RESOURCES",
+        f"   Purpose: OAuth 2.0 authentication for MCP server",
+        f"   Grant Type: client_credentials (service-to-service)"
+    ])
+    
+    region = _REGION
+    cognito_client = _client('cognito-idp', region)
+    secrets_client = _client('secretsmanager', region)
+    # Resolve modeled exception classes once, outside the try block
+    LimitExceeded = cognito_client.exceptions.LimitExceededException
+    InvalidParameter = cognito_client.exceptions.InvalidParameterException
     
     pool_name = config.cognito_user_pool_name
+    api_identifier = config.oauth_api_identifier
     
     try:
-        print(f"\n   Creating Cognito User Pool")
-        print(f"   Pool Name: {pool_name}")
-        print(f"   Password Policy: Minimum 8 characters")
+        _log_block([
+            f"\n   Creating Cognito User Pool",
+            f"   Pool Name: {pool_name}",
+            f"   Password Policy: Minimum 8 characters"
+        ])
         
         user_pool_response = cognito_client.create_user_pool(
             PoolName=pool_name,
@@ -109,34 +215,48 @@ def setup_cognito_user_pool():
         pool_id = user_pool_response['UserPool']['Id']
         print(f"   ✅ User Pool Created successfully")
         
-        domain_prefix = f"nova-insurance-mcp-{os.urandom(4).hex()}"
-        
-        print(f"\n   Creating Cognito Domain")
-        print(f"   Domain Prefix: {domain_prefix}")
-        print(f"   Purpose: OAuth 2.0 token endpoint")
-        
-        cognito_client.create_user_pool_domain(Domain=domain_prefix, UserPoolId=pool_id)
+        domain_prefix = f"nova-insurance-mcp-{secrets.token_hex(4)}"
+        
+        _log_block([
+            f"\n   Creating Cognito Domain",
+            f"   Domain Prefix: {domain_prefix}",
+            f"   Purpose: OAuth 2.0 token endpoint"
+        ])
+        
+        _log_block([
+            f"\n   Creating Resource Server (API Scopes)",
+            f"   API Identifier: {api_identifier}",
+            f"   Scopes: read, write"
+        ])
+        
+        # Domain and resource server only depend on the pool, so create them together
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            domain_future = executor.submit(
+                cognito_client.create_user_pool_domain,
+                Domain=domain_prefix,
+                UserPoolId=pool_id
+            )
+            resource_server_future = executor.submit(
+                cognito_client.create_resource_server,
+                UserPoolId=pool_id,
+                Identifier=api_identifier,
+                Name="Nova Insurance Underwriting API",
+                Scopes=[
+                    {'ScopeName': 'read', 'ScopeDescription': 'Read access to insurance data'},
+                    {'ScopeName': 'write', 'ScopeDescription': 'Write access for underwriting decisions'}
+                ]
+            )
+            domain_future.result()
+            resource_server_future.result()
         print(f"   ✅ Domain Created: {domain_prefix}.auth.{region}.amazoncognito.com")
-        
-        print(f"\n   Creating Resource Server (API Scopes)")
-        print(f"   API Identifier: {config.oauth_api_identifier}")
-        print(f"   Scopes: read, write")
-        
-        cognito_client.create_resource_server(
-            UserPoolId=pool_id,
-            Identifier=config.oauth_api_identifier,
-            Name="Nova Insurance Underwriting API",
-            Scopes=[
-                {'ScopeName': 'read', 'ScopeDescription': 'Read access to insurance data'},
-                {'ScopeName': 'write', 'ScopeDescription': 'Write access for underwriting decisions'}
-            ]
-        )
         print(f"   ✅ Resource Server Created with OAuth scopes")
         
-        print(f"\n   Creating Service Client (OAuth Credentials)")
-        print(f"   Client Name: NovaInsuranceServiceClient")
-        print(f"   OAuth Flow: client_credentials")
-        print(f"   Generating client secret...")
+        _log_block([
+            f"\n   Creating Service Client (OAuth Credentials)",
+            f"   Client Name: NovaInsuranceServiceClient",
+            f"   OAuth Flow: client_credentials",
+            f"   Generating client secret..."
+        ])
         
         service_client_response = cognito_client.create_user_pool_client(
             UserPoolId=pool_id,
@@ -144,7 +264,7 @@ def setup_cognito_user_pool():
             GenerateSecret=True,
             SupportedIdentityProviders=['COGNITO'],
             AllowedOAuthFlows=['client_credentials'],
-            AllowedOAuthScopes=[f'{config.oauth_api_identifier}/read', f'{config.oauth_api_identifier}/write'],
+            AllowedOAuthScopes=[f'{api_identifier}/read', f'{api_identifier}/write'],
             AllowedOAuthFlowsUserPoolClient=True
         )
         
@@ -171,14 +291,16 @@ def setup_cognito_user_pool():
         
         secret_response = secrets_client.create_secret(
             Name=secret_name,
-            SecretString=json.dumps(secret_value)
+            SecretString=_dumps(secret_value)
         )
         print(f"   ✅ Secret Created.")
         
-        print(f"\n✅ COGNITO AUTHENTICATION SETUP COMPLETE")
-        print(f"   Token URL: {oauth_token_url}")
-        print(f"   Discovery URL: {discovery_url}")
-        print(f"   ⚠️  Credentials stored in Secrets Manager (name redacted for security)")
+        _log_block([
+            f"\n✅ COGNITO AUTHENTICATION SETUP COMPLETE",
+            f"   Token URL: {oauth_token_url}",
+            f"   Discovery URL: {discovery_url}",
+            f"   ⚠️  Credentials stored in Secrets Manager (name redacted for security)"
+        ])
         
         return {
             'pool_id': pool_id,
@@ -189,25 +311,22 @@ def setup_cognito_user_pool():
             'domain_prefix': domain_prefix,
             'secret_arn': secret_response['ARN']
         }
-    except cognito_client.exceptions.LimitExceededException:
+    except LimitExceeded:
         print("❌ Cognito resource limit exceeded - contact AWS support")
         return None
-    except cognito_client.exceptions.InvalidParameterException as e:
+    except InvalidParameter as e:
         print(f"❌ Invalid Cognito configuration: {e}")
         return None
     except Exception as e:
         print(f"❌ Cognito setup error: {type(e).__name__}")
         return None
 
-def create_quicksuite_integration_doc(agent_endpoint, cognito_config, region):
-    """Create Quick Suite integration document with actual deployment values"""
-    from datetime import datetime
-    
-    doc_content = f"""# Amazon Quick Suite Integration Guide
+# Quick Suite integration guide, filled in with deployment values
+_QS_TEMPLATE = string.Template("""# Amazon Quick Suite Integration Guide
 ## Insurance Underwriting Expert MCP Server
 
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  
-**Region:** {region}  
+**Generated:** $generated  
+**Region:** $region  
 **MCP Server:** Insurance Underwriting Expert
 
 ---
@@ -241,7 +360,7 @@ This guide walks you through integrating the Insurance Underwriting Expert MCP S
 ```
 Name: Insurance Underwriting Expert
 Description: MCP Server for AI-powered insurance underwriting and risk assessment
-MCP Server Endpoint: {agent_endpoint}
+MCP Server Endpoint: $agent_endpoint
 ```
 
 Click **Next**
@@ -252,8 +371,8 @@ Click **Next**
 
 **OAuth Credentials:**
 ```
-Client ID: {cognito_config['service_client_id']}
-Token URL: {cognito_config['oauth_token_url']}
+Client ID: $client_id
+Token URL: $token_url
 ```
 
 **Client Secret:** Retrieve from AWS Secrets Manager (contact administrator for secret name).
@@ -399,7 +518,7 @@ Investigate claim CLM-0492 - does it show fraud indicators?
 Show all denied claims with fraud indicators above 2
 Which claims were filed within 60 days of policy start date?
 Analyze auto accident claims vs medical claims - which have higher fraud rates?
-Find claims over $90,000 that were approved - justify these decisions
+Find claims over $$90,000 that were approved - justify these decisions
 ```
 
 #### Portfolio Analytics
@@ -413,7 +532,7 @@ What percentage of our applicants are smokers with poor health status?
 
 #### Underwriting Decisions
 ```
-Should we approve APP-0831 for a $500,000 life insurance policy?
+Should we approve APP-0831 for a $$500,000 life insurance policy?
 Make underwriting decision for APP-0255 - consider all risk factors
 What premium adjustment would you recommend for applicants with 3+ previous claims?
 Compare underwriting decisions for married vs widowed applicants over 60
@@ -436,141 +555,210 @@ Compare underwriting decisions for married vs widowed applicants over 60
 - Check CloudWatch logs for detailed error messages
 
 **Data Access Issues:**
-- Verify DynamoDB tables exist: `{config.applicants_table}`, `{config.claims_table}`
-- Confirm S3 bucket access: `{config.s3_bucket_name}`
+- Verify DynamoDB tables exist: `$applicants_table`, `$claims_table`
+- Confirm S3 bucket access: `$s3_bucket_name`
 
 ---
 
 
 
 ```
-"""
+""")
+
+def create_quicksuite_integration_doc(agent_endpoint, cognito_config, region):
+    """Create Quick Suite integration document with actual deployment values"""
+    from datetime import datetime
     
-    # Write to docs directory
-    docs_dir = '../docs'
-    if not os.path.exists(docs_dir):
-        os.makedirs(docs_dir)
+    doc_content = _QS_TEMPLATE.substitute(
+        generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        region=region,
+        agent_endpoint=agent_endpoint,
+        client_id=cognito_config['service_client_id'],
+        token_url=cognito_config['oauth_token_url'],
+        applicants_table=config.applicants_table,
+        claims_table=config.claims_table,
+        s3_bucket_name=config.s3_bucket_name
+    )
     
-    doc_path = os.path.join(docs_dir, 'QUICK_SUITE_INTEGRATION.md')
-    with open(doc_path, 'w', encoding='utf-8') as f:
-        f.write(doc_content)
+    # Write to docs directory
+    _DOCS_DIR.mkdir(parents=True, exist_ok=True)
+    doc_path = _DOCS_DIR / 'QUICK_SUITE_INTEGRATION.md'
+    doc_path.write_text(doc_content, encoding='utf-8')
     
     print(f"\n📄 Quick Suite integration document created: {doc_path}")
 
+# Single inline policy for the runtime execution role, rendered with deployment values
+RUNTIME_POLICY_NAME = "NovaInsuranceRuntimeAccess"
+# Per-service inline policies from earlier deployments, superseded by RUNTIME_POLICY_NAME
+LEGACY_POLICY_NAMES = ("NovaInsuranceDynamoDBAccess", "NovaInsuranceS3Access", "NovaInsuranceBedrockAccess")
+_RUNTIME_POLICY_TEMPLATE = string.Template("""{
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Sid": "DynamoDBAccess",
+            "Effect": "Allow",
+            "Action": ["dynamodb:GetItem", "dynamodb:Query", "dynamodb:Scan", "dynamodb:DescribeTable"],
+            "Resource": [
+                "arn:aws:dynamodb:$region:$account_id:table/$applicants_table",
+                "arn:aws:dynamodb:$region:$account_id:table/$claims_table",
+                "arn:aws:dynamodb:$region:$account_id:table/$claims_table/index/*",
+                "arn:aws:dynamodb:$region:$account_id:table/nova-insurance-*"
+            ]
+        },
+        {
+            "Sid": "S3Access",
+            "Effect": "Allow",
+            "Action": ["s3:GetObject", "s3:ListBucket"],
+            "Resource": [
+                "arn:aws:s3:::$bucket/*",
+                "arn:aws:s3:::$bucket"
+            ]
+        },
+        {
+            "Sid": "BedrockAccess",
+            "Effect": "Allow",
+            "Action": ["bedrock:InvokeModel", "bedrock:Converse"],
+            "Resource": ["arn:aws:bedrock:*::foundation-model/$model_id"]
+        }
+    ]
+}""")
+
 def add_permissions(execution_role_name, region):
     """Add DynamoDB, S3, and Bedrock permissions to execution role"""
-    print(f"\n🔒 ADDING IAM PERMISSIONS TO EXECUTION ROLE")
-    print(f"   Role Name: {execution_role_name}")
-    print(f"   Purpose: Grant MCP server access to enterprise data sources")
+    _log_block([
+        f"\n🔒 ADDING IAM PERMISSIONS TO EXECUTION ROLE",
+        f"   Role Name: {execution_role_name}",
+        f"   Purpose: Grant MCP server access to enterprise data sources"
+    ])
+    
+    iam_client = _client('iam', region)
+    EntityAlreadyExists = iam_client.exceptions.EntityAlreadyExistsException
+    NoSuchEntity = iam_client.exceptions.NoSuchEntityException
     
     try:
-        iam_client = boto3.client('iam', region_name=region)
-        account_id = boto3.client('sts').get_caller_identity()['Account']
+        account_id = _account_id()
         print(f"   AWS Account: {account_id}")
         print(f"   Region: {region}")
         
-        dynamodb_policy = {
-            "Version": "2012-10-17",
-            "Statement": [{
-                "Effect": "Allow",
-                "Action": ["dynamodb:GetItem", "dynamodb:Query", "dynamodb:Scan", "dynamodb:DescribeTable"],
-                "Resource": [
-                    f"arn:aws:dynamodb:{region}:{account_id}:table/{config.applicants_table}",
-                    f"arn:aws:dynamodb:{region}:{account_id}:table/{config.claims_table}",
-                    f"arn:aws:dynamodb:{region}:{account_id}:table/nova-insurance-*"
-                ]
-            }]
-        }
-        
-        s3_policy = {
-            "Version": "2012-10-17",
-            "Statement": [{
-                "Effect": "Allow",
-                "Action": ["s3:GetObject", "s3:ListBucket"],
-                "Resource": [
-                    f"arn:aws:s3:::{config.s3_bucket_name}/*",
-                    f"arn:aws:s3:::{config.s3_bucket_name}"
-                ]
-            }]
-        }
-        
-        bedrock_policy = {
-            "Version": "2012-10-17",
-            "Statement": [{
-                "Effect": "Allow",
-                "Action": ["bedrock:InvokeModel", "bedrock:Converse"],
-                "Resource": [f"arn:aws:bedrock:*::foundation-model/{config.model_id}"]
-            }]
-        }
+        policy_values = dict(
+            region=region,
+            account_id=account_id,
+            applicants_table=config.applicants_table,
+            claims_table=config.claims_table,
+            bucket=config.s3_bucket_name,
+            model_id=config.model_id
+        )
+        runtime_policy = _RUNTIME_POLICY_TEMPLATE.substitute(policy_values)
+        
+        _log_block([
+            f"\n   Policy: {RUNTIME_POLICY_NAME}",
+            f"\n   Statement 1: DynamoDB",
+            f"   Actions: GetItem, Query, Scan, DescribeTable",
+            f"   Resources:",
+            f"     - {config.applicants_table}",
+            f"     - {config.claims_table}",
+            f"     - {config.claims_table}/index/*"
+        ])
+        
+        _log_block([
+            f"\n   Statement 2: S3",
+            f"   Actions: GetObject",
+            f"   Resources: {config.s3_bucket_name}/*"
+        ])
+        
+        _log_block([
+            f"\n   Statement 3: Bedrock",
+            f"   Actions: InvokeModel, Converse",
+            f"   Resources: amazon.nova-lite-1-5-v1:0"
+        ])
+        
+        # One inline policy keeps this to a single IAM call and a single policy slot on the role
+        iam_client.put_role_policy(
+            RoleName=execution_role_name,
+            PolicyName=RUNTIME_POLICY_NAME,
+            PolicyDocument=runtime_policy
+        )
+        print(f"\n   ✅ DynamoDB, S3 and Bedrock permissions attached")
         
-        print(f"\n   Policy 1: NovaInsuranceDynamoDBAccess")
-        print(f"   Actions: GetItem, Query, Scan, DescribeTable")
-        print(f"   Resources:")
-        print(f"     - {config.applicants_table}")
-        print(f"     - {config.claims_table}")
-        iam_client.put_role_policy(RoleName=execution_role_name, PolicyName="NovaInsuranceDynamoDBAccess", PolicyDocument=json.dumps(dynamodb_policy))
-        print(f"   ✅ DynamoDB policy attached")
-        
-        print(f"\n   Policy 2: NovaInsuranceS3Access")
-        print(f"   Actions: GetObject")
-        print(f"   Resources: {config.s3_bucket_name}/*")
-        iam_client.put_role_policy(RoleName=execution_role_name, PolicyName="NovaInsuranceS3Access", PolicyDocument=json.dumps(s3_policy))
-        print(f"   ✅ S3 policy attached")
-        
-        print(f"\n   Policy 3: NovaInsuranceBedrockAccess")
-        print(f"   Actions: InvokeModel, Converse")
-        print(f"   Resources: amazon.nova-lite-1-5-v1:0")
-        iam_client.put_role_policy(RoleName=execution_role_name, PolicyName="NovaInsuranceBedrockAccess", PolicyDocument=json.dumps(bedrock_policy))
-        print(f"   ✅ Bedrock policy attached")
+        # Drop the legacy policies so the combined policy is the role's only grant
+        for policy_name in LEGACY_POLICY_NAMES:
+            try:
+                iam_client.delete_role_policy(RoleName=execution_role_name, PolicyName=policy_name)
+                print(f"   🧹 Removed legacy policy: {policy_name}")
+            except NoSuchEntity:
+                pass
         
         print(f"\n✅ ALL IAM PERMISSIONS SUCCESSFULLY ATTACHED TO ROLE: {execution_role_name}")
-    except iam_client.exceptions.EntityAlreadyExistsException:
+    except EntityAlreadyExists:
         print(f"\n✅ IAM PERMISSIONS ALREADY EXIST (policies already attached)")
     except Exception as e:
         print(f"⚠️  Warning: Could not add permissions: {e}")
 
-def deploy_mcp_server():
-    """Deploy or update MCP server"""
-    # First step: Copy config file to deployment directory for Docker build
+def deploy_mcp_server(assume_yes=False):
+    """Deploy or update MCP server (assume_yes skips the update confirmation prompt)"""
+    # Heavy toolkit import is only needed for an actual deployment
+    import filecmp
     import shutil
+    from bedrock_agentcore_starter_toolkit import Runtime
+    
+    # First step: Copy config file to deployment directory for Docker build
     config_source = '../config/enterprise_config.yaml'
     config_dest = './enterprise_config.yaml'
     
     if os.path.exists(config_source):
-        shutil.copy2(config_source, config_dest)
-        print(f"📋 Copied config file: {config_source} → {config_dest}")
+        # mtimes are unreliable after a checkout or pull, so only skip a link to the same file or identical contents
+        if os.path.exists(config_dest) and (
+            os.path.samefile(config_source, config_dest) or filecmp.cmp(config_source, config_dest, shallow=False)
+        ):
+            print(f"📋 Config file up to date: {config_dest}")
+        else:
+            # Hardlink when possible so no bytes are copied; fall back to a copy across filesystems
+            try:
+                if os.path.exists(config_dest):
+                    os.unlink(config_dest)
+                os.link(config_source, config_dest)
+            except OSError:
+                shutil.copy2(config_source, config_dest)
+            print(f"📋 Copied config file: {config_source} → {config_dest}")
     else:
         print(f"⚠️  Config file not found at {config_source}, using defaults")
     
-    boto_session = Session()
-    region = boto_session.region_name
+    region = _REGION
     mcp_server_name = config.mcp_server_name
     
-    print("="*80)
-    print(f"🚀 MCP SERVER DEPLOYMENT")
-    print("="*80)
-    print(f"\n🎯 DEPLOYMENT CONFIGURATION")
-    print(f"   MCP Server Name: {mcp_server_name}")
-    print(f"   AWS Region: {region}")
-    print(f"   DynamoDB Tables: {config.applicants_table}, {config.claims_table}")
-    print(f"   S3 Bucket: {config.s3_bucket_name}")
-    print(f"   Cognito Pool: {config.cognito_user_pool_name}")
+    _log_block([
+        "="*80,
+        f"🚀 MCP SERVER DEPLOYMENT",
+        "="*80,
+        f"\n🎯 DEPLOYMENT CONFIGURATION",
+        f"   MCP Server Name: {mcp_server_name}",
+        f"   AWS Region: {region}",
+        f"   DynamoDB Tables: {config.applicants_table}, {config.claims_table}",
+        f"   S3 Bucket: {config.s3_bucket_name}",
+        f"   Cognito Pool: {config.cognito_user_pool_name}"
+    ])
     
     # Check existing server
     existing_config = check_existing_mcp_server(mcp_server_name, region)
     
     if existing_config:
-        print("\n" + "="*80)
-        print(f"⚠️  EXISTING MCP SERVER DETECTED")
-        print("="*80)
-        print(f"   Server Name: {mcp_server_name}")
-        print(f"   Runtime ID: {existing_config['agent_runtime_id']}")
-        print(f"   Region: {region}")
-        print(f"   Execution Role: {existing_config['execution_role_name']}")
-        print(f"\n   UPDATE MODE: Will update server code only (no resource recreation)")
-        print(f"   PRESERVED: Cognito, IAM roles, authentication configuration")
-        
-        response = input("\n❓ Do you want to update the existing server? (y/n): ").strip().lower()
+        _log_block([
+            "\n" + "="*80,
+            f"⚠️  EXISTING MCP SERVER DETECTED",
+            "="*80,
+            f"   Server Name: {mcp_server_name}",
+            f"   Runtime ID: {existing_config['agent_runtime_id']}",
+            f"   Region: {region}",
+            f"   Execution Role: {existing_config['execution_role_name']}",
+            f"\n   UPDATE MODE: Will update server code only (no resource recreation)",
+            f"   PRESERVED: Cognito, IAM roles, authentication configuration"
+        ])
+        
+        if assume_yes or os.environ.get('AGENTCORE_ASSUME_YES') == '1':
+            print("\n❓ Do you want to update the existing server? (y/n): y (assumed)")
+            response = 'y'
+        else:
+            response = input("\n❓ Do you want to update the existing server? (y/n): ").strip().lower()
         
         if response not in ['y', 'yes']:
             if response not in ['n', 'no']:
@@ -578,16 +766,20 @@ def deploy_mcp_server():
             print("\n❌ DEPLOYMENT CANCELLED BY USER")
             sys.exit(2)
         
-        print("\n" + "="*80)
-        print("🔄 UPDATE MODE: Deploying new code to existing server")
-        print("="*80)
+        _log_block([
+            "\n" + "="*80,
+            "🔄 UPDATE MODE: Deploying new code to existing server",
+            "="*80
+        ])
         cognito_config = existing_config['cognito_config']
         execution_role_name = existing_config['execution_role_name']
         reuse_existing = True
     else:
-        print("\n" + "="*80)
-        print("🆕 NEW DEPLOYMENT MODE: Creating all resources from scratch")
-        print("="*80)
+        _log_block([
+            "\n" + "="*80,
+            "🆕 NEW DEPLOYMENT MODE: Creating all resources from scratch",
+            "="*80
+        ])
         cognito_config = setup_cognito_user_pool()
         if not cognito_config:
             raise Exception("Failed to setup Cognito")
@@ -600,15 +792,11 @@ def deploy_mcp_server():
             raise FileNotFoundError(f"Required file {file_path} not found")
     
     # Configure AgentCore (suppress verbose output)
-    import contextlib
-    import io
-    
     print(f"\n⚙️ CONFIGURING AGENTCORE RUNTIME")
     print(f"   Initializing Bedrock AgentCore SDK...")
     
     # Capture AgentCore verbose output
-    f = io.StringIO()
-    with contextlib.redirect_stdout(f), contextlib.redirect_stderr(f):
+    with _capture():
         agentcore_runtime = Runtime()
     
     print(f"   ✅ AgentCore SDK initialized")
@@ -635,92 +823,60 @@ def deploy_mcp_server():
     else:
         print(f"   - Execution Role: Auto-create new role")
     
-    print(f"   - Entrypoint: {config_params['entrypoint']}")
-    print(f"   - Agent Name: {config_params['agent_name']}")
-    print(f"   - Protocol: {config_params['protocol']}")
-    print(f"   - Region: {config_params['region']}")
-    print(f"   - ECR: Auto-create repository")
-    print(f"   - Authentication: Custom JWT (Cognito)")
-    print(f"   - Allowed Client: {cognito_config['service_client_id']}")
+    _log_block([
+        f"   - Entrypoint: {config_params['entrypoint']}",
+        f"   - Agent Name: {config_params['agent_name']}",
+        f"   - Protocol: {config_params['protocol']}",
+        f"   - Region: {config_params['region']}",
+        f"   - ECR: Auto-create repository",
+        f"   - Authentication: Custom JWT (Cognito)",
+        f"   - Allowed Client: {cognito_config['service_client_id']}"
+    ])
     
     # Configure with suppressed output
-    with contextlib.redirect_stdout(f), contextlib.redirect_stderr(f):
+    with _capture():
         agentcore_runtime.configure(**config_params)
     print(f"\n   ✅ AgentCore configuration validated and applied")
     
-    # Verify IAM roles are accessible before launching (only for new deployments)
-    if not reuse_existing:
-        print(f"\n⏳ VERIFYING IAM ROLES PROPAGATION")
-        print(f"   Purpose: Ensure IAM roles are globally available before CodeBuild starts")
-        print(f"   Method: Retry with backoff (max 2 minutes)")
-        
-        iam_client = boto3.client('iam', region_name=region)
-        account_id = boto3.client('sts').get_caller_identity()['Account']
-        
-        # Expected role names that AgentCore will create
-        runtime_role_prefix = f"AmazonBedrockAgentCoreSDKRuntime-{region}"
-        codebuild_role_prefix = f"AmazonBedrockAgentCoreSDKCodeBuild-{region}"
-        
-        max_attempts = 24  # 2 minutes with 5-second intervals
-        attempt = 0
-        roles_verified = False
-        
-        while attempt < max_attempts and not roles_verified:
-            attempt += 1
-            try:
-                print(f"   Attempt {attempt}/{max_attempts}: Checking IAM roles...", end='', flush=True)
-                
-                # List roles and check if our expected roles exist
-                response = iam_client.list_roles()
-                role_names = [role['RoleName'] for role in response.get('Roles', [])]
-                
-                runtime_role_exists = any(runtime_role_prefix in name for name in role_names)
-                codebuild_role_exists = any(codebuild_role_prefix in name for name in role_names)
-                
-                if runtime_role_exists and codebuild_role_exists:
-                    print(f" ✅ Verified")
-                    roles_verified = True
-                else:
-                    print(f" Roles not ready yet")
-                    time.sleep(5) # nosec
-                    
-            except Exception as e:
-                print(f" Error: {e}")
-                time.sleep(5) # nosec
-        
-        if roles_verified:
-            print(f"   ✅ IAM roles verified and ready (took {attempt * 5} seconds)")
-        else:
-            print(f"   ⚠️ Verification timed out - proceeding anyway (roles may still be propagating)")
-    
     # Launch with suppressed output
     print(f"\n🚀 DEPLOYING TO BEDROCK AGENTCORE RUNTIME")
     if not reuse_existing:
         print(f"   Creating new execution role (auto-created by AgentCore)...")
-    print(f"   Building Docker container image...")
-    print(f"   Pushing to Amazon ECR...")
-    print(f"   {'Creating' if not reuse_existing else 'Updating'} AgentCore runtime...")
+    _log_block([
+        f"   Building Docker container image...",
+        f"   Pushing to Amazon ECR...",
+        f"   {'Creating' if not reuse_existing else 'Updating'} AgentCore runtime..."
+    ])
     
-    with contextlib.redirect_stdout(f), contextlib.redirect_stderr(f):
+    with _capture():
         launch_result = agentcore_runtime.launch(auto_update_on_conflict=True)
     
     print(f"   ✅ AgentCore runtime {'created' if not reuse_existing else 'updated'}")
     print(f"   Runtime ARN: {launch_result.agent_arn}")
     
     # Verify IAM role immediately after creation (for new deployments)
-    agentcore_client = boto3.client('bedrock-agentcore-control', region_name=region)
+    agentcore_client = _client('bedrock-agentcore-control', region)
     runtime_id = launch_result.agent_arn.split('/')[-1]
+    _save_runtime_cache(mcp_server_name, runtime_id)
     
     if not reuse_existing:
-        print(f"\n⏳ VERIFYING IAM ROLE CREATION AND PROPAGATION")
-        print(f"   Purpose: Ensure execution role created by AgentCore is accessible")
-        print(f"   Method: Retry with backoff (max 2 minutes)")
-        
-        max_attempts = 24  # 2 minutes with 5-second intervals
+        _log_block([
+            f"\n⏳ VERIFYING IAM ROLE CREATION AND PROPAGATION",
+            f"   Purpose: Ensure execution role created by AgentCore is accessible",
+            f"   Method: Retry with backoff (max 2 minutes)"
+        ])
+        
+        iam_client = _client('iam', region)
+        # Resolve modeled exception classes once rather than on every retry
+        RuntimeNotFound = agentcore_client.exceptions.ResourceNotFoundException
+        max_attempts = 24  # Exponential backoff from 0.5s, capped at 8s
         attempt = 0
-        role_verified = False
+        delay = 0.5
+        execution_role_arn = None
+        start_time = time.monotonic()
         
-        while attempt < max_attempts and not role_verified:
+        # The runtime reports its execution role once AgentCore has created it
+        while attempt < max_attempts and not execution_role_arn:
             attempt += 1
             try:
                 print(f"   Attempt {attempt}/{max_attempts}: Checking role existence...", end='', flush=True)
@@ -733,34 +889,42 @@ def deploy_mcp_server():
                 execution_role_arn = runtime_details.get('roleArn')
                 if not execution_role_arn:
                     print(" Role ARN not yet available")
-                    time.sleep(5) # nosec
-                    continue
-                
-                execution_role_name = execution_role_arn.split('/')[-1]
-                
-                # Verify role is accessible via IAM
-                iam_client = boto3.client('iam', region_name=region)
-                iam_client.get_role(RoleName=execution_role_name)
-                
-                print(f" ✅ Verified")
-                print(f"   Role ARN: {execution_role_arn}")
-                print(f"   Role Name: {execution_role_name}")
-                role_verified = True
+                else:
+                    print(" Role ARN available")
                 
-            except agentcore_client.exceptions.ResourceNotFoundException:
+            except RuntimeNotFound:
                 print(" Runtime not ready yet")
-                time.sleep(5) # nosec
-            except iam_client.exceptions.NoSuchEntityException:
-                print(" Role not propagated yet")
-                time.sleep(5) # nosec
             except Exception as e:
                 print(f" Error: {e}")
-                time.sleep(5) # nosec
+            
+            if not execution_role_arn:
+                time.sleep(delay * (0.8 + 0.4 * random.random())) # nosec
+                delay = min(delay * 1.7, 8.0)
         
-        if not role_verified:
-            raise Exception(f"IAM role failed to propagate after {max_attempts * 5} seconds")
+        if not execution_role_arn:
+            raise Exception(f"Execution role not reported by AgentCore after {time.monotonic() - start_time:.0f} seconds")
         
-        print(f"\n   ✅ IAM ROLE VERIFIED AND READY (took {attempt * 5} seconds)")
+        execution_role_name = execution_role_arn.split('/')[-1]
+        
+        # IAM's own waiter polls get_role until the role is visible
+        print(f"   Waiting for role to propagate in IAM...", end='', flush=True)
+        try:
+            iam_client.get_waiter('role_exists').wait(
+                RoleName=execution_role_name,
+                WaiterConfig={'Delay': 2, 'MaxAttempts': 30}
+            )
+        except WaiterError as e:
+            print("")
+            raise Exception(f"IAM role failed to propagate after {time.monotonic() - start_time:.0f} seconds: {e}")
+        
+        elapsed = time.monotonic() - start_time
+        _log_block([
+            f" ✅ Verified",
+            f"   Role ARN: {execution_role_arn}",
+            f"   Role Name: {execution_role_name}"
+        ])
+        
+        print(f"\n   ✅ IAM ROLE VERIFIED AND READY (took {elapsed:.1f} seconds)")
         
         # Add permissions to newly created role
         add_permissions(execution_role_name, region)
@@ -777,10 +941,12 @@ def deploy_mcp_server():
         current_execution_role_arn = runtime_details['roleArn']
         current_execution_role_name = current_execution_role_arn.split('/')[-1]
         
-        print(f"   Current Role ARN: {current_execution_role_arn}")
-        print(f"   Current Role Name: {current_execution_role_name}")
-        print(f"\n🔍 VERIFYING IAM PERMISSIONS (Update mode)")
-        print(f"   Ensuring policies are attached to current role")
+        _log_block([
+            f"   Current Role ARN: {current_execution_role_arn}",
+            f"   Current Role Name: {current_execution_role_name}",
+            f"\n🔍 VERIFYING IAM PERMISSIONS (Update mode)",
+            f"   Ensuring policies are attached to current role"
+        ])
         
         add_permissions(current_execution_role_name, region)
     
@@ -792,31 +958,42 @@ def deploy_mcp_server():
     if not reuse_existing:
         create_quicksuite_integration_doc(agent_endpoint, cognito_config, region)
     
-    print("\n" + "="*80)
-    print(f"✅ {'UPDATE' if reuse_existing else 'DEPLOYMENT'} COMPLETED SUCCESSFULLY!")
-    print("="*80)
-    print(f"\n📦 DEPLOYED RESOURCES:")
+    _log_block([
+        "\n" + "="*80,
+        f"✅ {'UPDATE' if reuse_existing else 'DEPLOYMENT'} COMPLETED SUCCESSFULLY!",
+        "="*80,
+        f"\n📦 DEPLOYED RESOURCES:"
+    ])
     if not reuse_existing:
-        print(f"   ✅ Cognito User Pool: {config.cognito_user_pool_name}")
-        print(f"   ✅ OAuth Client: Created with client_credentials flow")
-        print(f"   ✅ Secrets Manager: {config.mcp_server_name}/cognito/credentials")
-        print(f"   ✅ IAM Execution Role: Auto-created by AgentCore")
-        print(f"   ✅ IAM Policies: DynamoDB, S3, Bedrock access attached")
-    print(f"   ✅ AgentCore Runtime: {mcp_server_name}")
-    print(f"   ✅ MCP Server Endpoint: {agent_endpoint}")
-    print(f"   ✅ Docker Image: Pushed to Amazon ECR")
-    print(f"\n📊 DATA SOURCES:")
-    print(f"   DynamoDB: {config.applicants_table}, {config.claims_table}")
-    print(f"   S3: {config.s3_bucket_name}/{config.medical_records_prefix}/")
-    print(f"\n📝 NEXT STEPS:")
-    print(f"   1. Test: python tests/test_mcp_functionality.py")
+        _log_block([
+            f"   ✅ Cognito User Pool: {config.cognito_user_pool_name}",
+            f"   ✅ OAuth Client: Created with client_credentials flow",
+            f"   ✅ Secrets Manager: {config.mcp_server_name}/cognito/credentials",
+            f"   ✅ IAM Execution Role: Auto-created by AgentCore",
+            f"   ✅ IAM Policies: DynamoDB, S3, Bedrock access attached"
+        ])
+    _log_block([
+        f"   ✅ AgentCore Runtime: {mcp_server_name}",
+        f"   ✅ MCP Server Endpoint: {agent_endpoint}",
+        f"   ✅ Docker Image: Pushed to Amazon ECR",
+        f"\n📊 DATA SOURCES:",
+        f"   DynamoDB: {config.applicants_table}, {config.claims_table}",
+        f"   S3: {config.s3_bucket_name}/{config.medical_records_prefix}/",
+        f"\n📝 NEXT STEPS:",
+        f"   1. Test: python tests/test_mcp_functionality.py"
+    ])
     if not reuse_existing:
         print(f"   2. Integration guide: docs/QUICK_SUITE_INTEGRATION.md")
         print(f"   3. Connect Quick Suite using OAuth credentials")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Deploy or update the MCP server on Bedrock AgentCore")
+    parser.add_argument('-y', '--yes', '--no-prompt', dest='yes', action='store_true',
+                        help="Update an existing server without asking (or set AGENTCORE_ASSUME_YES=1)")
+    args = parser.parse_args()
+    
     try:
-        deploy_mcp_server()
+        deploy_mcp_server(assume_yes=args.yes)
     except KeyboardInterrupt:
         print("\n\n" + "="*80)
         print("❌ DEPLOYMENT CANCELLED BY USER (Ctrl+C)")
@@ -8,6 +8,12 @@ import os
 import sys
 from config_manager import config
 
+# Prefer the libyaml C dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 def generate_agentcore_config():
     """Generate AgentCore configuration with enterprise config values"""
     
@@ -44,7 +50,7 @@ def generate_agentcore_config():
     # Write to config directory
     config_path = '../config/bedrock_agentcore_nova.yaml'
     with open(config_path, 'w') as f:
-        yaml.dump(agentcore_config, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(agentcore_config, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
     
     print(f"✅ Generated AgentCore config: {config_path}")
     print(f"   MCP Server Name: {config.mcp_server_name}")
@@ -3,19 +3,75 @@
 Generate synthetic data for Insurance Underwriting MCP Server
 """
 
+import gzip
 import json
 import random
+import io
 import boto3
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
 from datetime import datetime, timedelta
 from faker import Faker
 from decimal import Decimal
 import sys
 import os
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, combinations, islice
+from math import comb
 # config_manager is in the same directory
-from config_manager import config
+from config_manager import config, RETRY_CFG
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
+# Concurrent S3 uploads for medical records (within RETRY_CFG's pool size)
+S3_UPLOAD_WORKERS = 32
+# Parallel batch_writer sessions per DynamoDB table during bulk load
+DYNAMODB_WRITE_SHARDS = 8
+# Below this many values, worker start-up costs more than Faker saves
+FAKER_POOL_MIN_ROWS = 20000
+
+# Single session shared by the DynamoDB and S3 loaders (one credential resolution)
+_SESSION = boto3.Session()
 
 fake = Faker()
 
+def _init_faker_worker():
+    """Give each worker process its own Faker with fresh randomness (forked workers share state)"""
+    global fake
+    fake = Faker()
+    Faker.seed()
+
+def _faker_values(task):
+    """Call a Faker method n times; module-level so it can be sent to worker processes"""
+    method, kwargs, n = task
+    generate = getattr(fake, method)
+    return [generate(**kwargs) for _ in range(n)]
+
+def faker_column(method, count, **kwargs):
+    """Generate a column of Faker values, spreading large counts across CPU cores"""
+    workers = os.cpu_count() or 1
+    if count < FAKER_POOL_MIN_ROWS or workers == 1:
+        return _faker_values((method, kwargs, count))
+    
+    chunk = -(-count // workers)
+    tasks = [(method, kwargs, min(chunk, count - start)) for start in range(0, count, chunk)]
+    with multiprocessing.Pool(workers, initializer=_init_faker_worker) as pool:
+        parts = pool.map(_faker_values, tasks)
+    return [value for part in parts for value in part]
+
+def sample_column(options, max_size, count):
+    """Draw random subsets of 0..max_size options for every row in one call"""
+    # Weighting each subset by 1/C(n, size) keeps the per-row distribution of
+    # random.sample(options, random.randint(0, max_size)): uniform size, uniform subset
+    subsets = [subset for size in range(max_size + 1) for subset in combinations(options, size)]
+    weights = [1 / comb(len(options), len(subset)) for subset in subsets]
+    return [list(subset) for subset in random.choices(subsets, weights=weights, k=count)]
+
 def generate_applicants(count=1000):
     """Generate synthetic applicant data for insurance underwriting simulation"""
     applicants = []
@@ -24,99 +80,159 @@ def generate_applicants(count=1000):
     # Health status categories used in underwriting decisions
     health_statuses = ['Excellent', 'Good', 'Fair', 'Poor']
     
+    # Draw each column in one call instead of one random call per field per row
+    # Realistic age range for insurance applicants
+    ages = random.choices(range(18, 76), k=count)
+    genders = random.choices(['Male', 'Female'], k=count)
+    occupation_draws = random.choices(occupations, k=count)
+    # Income range typical for insurance applicants ($30K-$200K)
+    incomes = random.choices(range(30000, 200001), k=count)
+    health_draws = random.choices(health_statuses, k=count)
+    smokers = random.choices([True, False], k=count)
+    # BMI range from underweight to obese (18.5-35.0), one decimal place
+    bmis = random.choices([tenths / 10 for tenths in range(185, 351)], k=count)
+    exercise_draws = random.choices(['Never', 'Rarely', 'Weekly', 'Daily'], k=count)
+    # Heart disease, diabetes and cancer flags, three per applicant
+    family_flags = random.choices([True, False], k=count * 3)
+    previous_claims = random.choices(range(0, 6), k=count)
+    credit_scores = random.choices(range(300, 851), k=count)
+    marital_draws = random.choices(['Single', 'Married', 'Divorced', 'Widowed'], k=count)
+    dependents = random.choices(range(0, 5), k=count)
+    # Personal information using Faker for realistic data
+    names = faker_column('name', count)
+    # Application date within last 2 years
+    created_dates = faker_column('date_between', count, start_date='-2y', end_date='today')
+    
     # Generate specified number of synthetic applicant profiles
     for i in range(count):
-        # Generate realistic age range for insurance applicants
-        age = random.randint(18, 75)
-        
         # Create comprehensive applicant profile with all underwriting factors
         applicant = {
             # Unique identifier following enterprise naming convention
             'applicant_id': f'APP-{i+1:04d}',
-            # Personal information using Faker for realistic data
-            'name': fake.name(),
-            'age': age,
-            'gender': random.choice(['Male', 'Female']),
+            'name': names[i],
+            'age': ages[i],
+            'gender': genders[i],
             # Occupation affects risk assessment (some jobs are higher risk)
-            'occupation': random.choice(occupations),
-            # Income range typical for insurance applicants ($30K-$200K)
-            'income': random.randint(30000, 200000),
+            'occupation': occupation_draws[i],
+            'income': incomes[i],
             # Overall health status for initial risk screening
-            'health_status': random.choice(health_statuses),
+            'health_status': health_draws[i],
             # Smoking status - major risk factor in insurance underwriting
-            'smoker': random.choice([True, False]),
-            # BMI range from underweight to obese (18.5-35.0)
-            'bmi': Decimal(str(round(random.uniform(18.5, 35.0), 1))),
+            'smoker': smokers[i],
+            'bmi': bmis[i],
             # Exercise frequency affects health risk assessment
-            'exercise_frequency': random.choice(['Never', 'Rarely', 'Weekly', 'Daily']),
+            'exercise_frequency': exercise_draws[i],
             # Family medical history - genetic risk factors
             'family_history': {
-                'heart_disease': random.choice([True, False]),
-                'diabetes': random.choice([True, False]),
-                'cancer': random.choice([True, False])
+                'heart_disease': family_flags[3 * i],
+                'diabetes': family_flags[3 * i + 1],
+                'cancer': family_flags[3 * i + 2]
             },
             # Claims history affects future risk assessment
-            'previous_claims': random.randint(0, 5),
+            'previous_claims': previous_claims[i],
             # Credit score correlates with claim frequency in actuarial data
-            'credit_score': random.randint(300, 850),
+            'credit_score': credit_scores[i],
             # Marital status affects risk profiles
-            'marital_status': random.choice(['Single', 'Married', 'Divorced', 'Widowed']),
+            'marital_status': marital_draws[i],
             # Number of dependents affects coverage needs
-            'dependents': random.randint(0, 4),
-            # Application date within last 2 years
-            'created_date': fake.date_between(start_date='-2y', end_date='today').isoformat()
+            'dependents': dependents[i],
+            'created_date': created_dates[i].isoformat()
         }
         applicants.append(applicant)
     
     return applicants
 
+class SizedIter:
+    """Single-pass iterable that also knows its length (for progress reporting)"""
+    
+    def __init__(self, iterable, length):
+        self._iterable = iterable
+        self._length = length
+    
+    def __len__(self):
+        return self._length
+    
+    def __iter__(self):
+        return iter(self._iterable)
+
 def generate_medical_records(applicants):
-    """Generate comprehensive medical records for underwriting analysis"""
-    records = []
+    """Generate comprehensive medical records for underwriting analysis without materializing them"""
+    return SizedIter(_iter_medical_records(applicants), len(applicants))
+
+def _iter_medical_records(applicants):
+    """Yield one medical record per applicant"""
     # Common chronic conditions that affect insurance risk assessment
     conditions = ['Hypertension', 'Diabetes', 'Asthma', 'Arthritis', 'Depression', 'Anxiety']
     # Medications corresponding to common conditions (affects risk evaluation)
     medications = ['Lisinopril', 'Metformin', 'Albuterol', 'Ibuprofen', 'Sertraline', 'Atorvastatin']
+    allergy_options = ['Peanuts', 'Shellfish', 'Penicillin', 'None']
+    surgery_options = ['Appendectomy', 'Knee Surgery', 'Heart Surgery', 'None']
+    
+    # Draw each numeric and list column in one call
+    count = len(applicants)
+    systolic = random.choices(range(90, 181), k=count)
+    diastolic = random.choices(range(60, 121), k=count)
+    cholesterol = random.choices(range(150, 301), k=count)
+    weights = random.choices(range(120, 301), k=count)
+    heights = random.choices(range(60, 79), k=count)
+    chronic_conditions = sample_column(conditions, 3, count)
+    current_medications = sample_column(medications, 2, count)
+    allergies = sample_column(allergy_options, 2, count)
+    surgeries = sample_column(surgery_options, 1, count)
+    hospitalizations = random.choices(range(0, 4), k=count)
+    # Recent medical checkup date (within last year)
+    checkup_dates = faker_column('date_between', count, start_date='-1y', end_date='today')
     
     # Generate medical record for each applicant
-    for applicant in applicants:
+    for i, applicant in enumerate(applicants):
         record = {
             # Link medical record to applicant profile
             'applicant_id': applicant['applicant_id'],
-            # Recent medical checkup date (within last year)
-            'last_checkup': fake.date_between(start_date='-1y', end_date='today').isoformat(),
+            'last_checkup': checkup_dates[i].isoformat(),
             # Vital signs - blood pressure in systolic/diastolic format
-            'blood_pressure': f"{random.randint(90, 180)}/{random.randint(60, 120)}",
+            'blood_pressure': f"{systolic[i]}/{diastolic[i]}",
             # Cholesterol levels (mg/dL) - affects cardiovascular risk
-            'cholesterol': Decimal(str(random.randint(150, 300))),
+            'cholesterol': cholesterol[i],
             # Physical measurements for BMI calculation and health assessment
-            'weight': Decimal(str(random.randint(120, 300))),  # pounds
-            'height': Decimal(str(random.randint(60, 78))),    # inches
+            'weight': weights[i],  # pounds
+            'height': heights[i],  # inches
             # Chronic conditions (0-3 conditions per person) - major risk factors
-            'chronic_conditions': random.sample(conditions, random.randint(0, 3)),
+            'chronic_conditions': chronic_conditions[i],
             # Current medications (0-2 medications) - indicates health management
-            'medications': random.sample(medications, random.randint(0, 2)),
+            'medications': current_medications[i],
             # Known allergies - important for medical underwriting
-            'allergies': random.sample(['Peanuts', 'Shellfish', 'Penicillin', 'None'], random.randint(0, 2)),
+            'allergies': allergies[i],
             # Surgical history - indicates past health issues
-            'surgeries': random.sample(['Appendectomy', 'Knee Surgery', 'Heart Surgery', 'None'], random.randint(0, 1)),
+            'surgeries': surgeries[i],
             # Number of hospitalizations - indicates health complexity
-            'hospitalizations': Decimal(str(random.randint(0, 3)))
+            'hospitalizations': hospitalizations[i]
         }
-        records.append(record)
-    
-    return records
+        yield record
 
-def generate_claims(count=500):
+def generate_claims(count=500, applicant_ids=None):
     """Generate synthetic insurance claims data with fraud detection patterns"""
+    # Link claims to already-minted applicant IDs rather than formatting new ones per claim
+    if applicant_ids is None:
+        applicant_ids = [f'APP-{n:04d}' for n in range(1, 1001)]
     claims = []
     # Different types of insurance claims for comprehensive fraud analysis
     claim_types = ['Auto Accident', 'Medical', 'Property Damage', 'Life', 'Disability']
     
+    # Draw each column in one call instead of one random call per field per row
+    claim_applicant_ids = random.choices(applicant_ids, k=count)
+    claim_type_draws = random.choices(claim_types, k=count)
+    claim_amounts = random.choices(range(1000, 100001), k=count)
+    policy_limits = random.choices(range(50000, 1000001), k=count)
+    statuses = random.choices(['Pending', 'Approved', 'Denied', 'Under Investigation'], k=count)
+    fraud_scores = random.choices(range(0, 6), k=count)
+    # Policy must start before claim can be filed (1-3 years ago)
+    policy_starts = faker_column('date_between', count, start_date='-3y', end_date='-1y')
+    # Claim description for analysis
+    descriptions = faker_column('text', count, max_nb_chars=200)
+    
     # Generate specified number of claims
     for i in range(count):
-        # Policy must start before claim can be filed (1-3 years ago)
-        policy_start = fake.date_between(start_date='-3y', end_date='-1y')
+        policy_start = policy_starts[i]
         # Claim date must be after policy start date
         claim_date = fake.date_between(start_date=policy_start, end_date='today')
         
@@ -124,13 +240,13 @@ def generate_claims(count=500):
             # Unique claim identifier following enterprise naming convention
             'claim_id': f'CLM-{i+1:04d}',
             # Link claim to existing applicant (random assignment for simulation)
-            'applicant_id': f'APP-{random.randint(1, 1000):04d}',
+            'applicant_id': claim_applicant_ids[i],
             # Type of insurance claim affects fraud patterns
-            'claim_type': random.choice(claim_types),
+            'claim_type': claim_type_draws[i],
             # Claim amount range $1K-$100K (realistic for most claims)
-            'claim_amount': Decimal(str(random.randint(1000, 100000))),
+            'claim_amount': claim_amounts[i],
             # Policy coverage limit (affects fraud detection when claim approaches limit)
-            'policy_limit': Decimal(str(random.randint(50000, 1000000))),
+            'policy_limit': policy_limits[i],
             # Policy inception date
             'policy_start_date': policy_start.isoformat(),
             # Date when claim was filed
@@ -138,16 +254,25 @@ def generate_claims(count=500):
             # Time between policy start and claim (fraud indicator if too short)
             'days_since_policy_start': (claim_date - policy_start).days,
             # Current claim processing status
-            'status': random.choice(['Pending', 'Approved', 'Denied', 'Under Investigation']),
-            # Claim description for analysis
-            'description': fake.text(max_nb_chars=200),
+            'status': statuses[i],
+            'description': descriptions[i],
             # Fraud indicator score (0-5, higher = more suspicious)
-            'fraud_indicators': random.randint(0, 5)
+            'fraud_indicators': fraud_scores[i]
         }
         claims.append(claim)
     
     return claims
 
+def to_dynamodb_item(obj):
+    """Convert float leaves to Decimal, which the DynamoDB resource requires for non-integers"""
+    if isinstance(obj, float):
+        return Decimal(repr(obj))
+    elif isinstance(obj, dict):
+        return {k: to_dynamodb_item(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [to_dynamodb_item(v) for v in obj]
+    return obj
+
 def create_dynamodb_tables():
     """Create DynamoDB tables using configuration"""
     config.check_and_create_resources()
@@ -155,61 +280,116 @@ def create_dynamodb_tables():
 def load_data_to_dynamodb(applicants, claims):
     """Load data to DynamoDB using configuration"""
     try:
-        dynamodb = boto3.resource('dynamodb', region_name=config.region)
+        dynamodb = _SESSION.resource('dynamodb', region_name=config.region, config=RETRY_CFG)
         
-        # Load applicants with error handling
-        print(f"📎 Loading {len(applicants)} applicant profiles to {config.applicants_table}...")
-        print(f"⏱️  Processing enterprise applicant data (30-45 seconds)")
-        applicants_table = dynamodb.Table(config.applicants_table)
+        def write_sharded(table, items, key_name):
+            # Each shard gets its own batch_writer so BatchWriteItem round trips overlap
+            def write_shard(shard):
+                with table.batch_writer(overwrite_by_pkeys=[key_name]) as batch:
+                    for item in shard:
+                        # Generated records hold plain numbers; Decimal is only needed at the write boundary
+                        batch.put_item(Item=to_dynamodb_item(item))
+            
+            shards = [items[i::DYNAMODB_WRITE_SHARDS] for i in range(DYNAMODB_WRITE_SHARDS)]
+            with ThreadPoolExecutor(max_workers=DYNAMODB_WRITE_SHARDS) as executor:
+                list(executor.map(write_shard, shards))
         
-        # Check if table exists first
+        # Check both tables exist before loading either
+        applicants_table = dynamodb.Table(config.applicants_table)
         try:
             applicants_table.load()
         except dynamodb.meta.client.exceptions.ResourceNotFoundException:
             raise RuntimeError("Applicants table does not exist")
         except Exception as e:
             raise RuntimeError(f"Database table not accessible: {type(e).__name__}")
-            
-        with applicants_table.batch_writer() as batch:
-            for applicant in applicants:
-                batch.put_item(Item=applicant)
-        print(f"✅ Successfully loaded {len(applicants)} applicant profiles")
         
-        # Load claims with error handling
-        print(f"📎 Loading {len(claims)} insurance claims to {config.claims_table}...")
-        print(f"⏱️  Processing claims data with fraud indicators (15-20 seconds)")
         claims_table = dynamodb.Table(config.claims_table)
-        
-        # Check if table exists first
         try:
             claims_table.load()
         except dynamodb.meta.client.exceptions.ResourceNotFoundException:
             raise RuntimeError("Claims table does not exist")
         except Exception as e:
             raise RuntimeError(f"Claims table not accessible: {type(e).__name__}")
-            
-        with claims_table.batch_writer() as batch:
-            for claim in claims:
-                batch.put_item(Item=claim)
-        print(f"✅ Successfully loaded {len(claims)} insurance claims")
+        
+        print(f"📎 Loading {len(applicants)} applicant profiles to {config.applicants_table}...")
+        print(f"📎 Loading {len(claims)} insurance claims to {config.claims_table}...")
+        print(f"⏱️  Processing applicant and claims data in parallel (30-45 seconds)")
+        
+        # The tables have independent capacity, so load them at the same time
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            applicants_future = executor.submit(write_sharded, applicants_table, applicants, 'applicant_id')
+            claims_future = executor.submit(write_sharded, claims_table, claims, 'claim_id')
+            applicants_future.result()
+            print(f"✅ Successfully loaded {len(applicants)} applicant profiles")
+            claims_future.result()
+            print(f"✅ Successfully loaded {len(claims)} insurance claims")
         
     except Exception as e:
         print(f"❌ Error loading data to DynamoDB: {e}")
         raise
 
-def decimal_to_float(obj):
-    """Convert Decimal objects to float for JSON serialization"""
+def _json_default(obj):
+    """Serialize Decimal values as floats"""
     if isinstance(obj, Decimal):
         return float(obj)
-    elif isinstance(obj, dict):
-        return {k: decimal_to_float(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [decimal_to_float(v) for v in obj]
-    return obj
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def record_to_json_bytes(record):
+    """Encode a record as UTF-8 JSON"""
+    if orjson:
+        return orjson.dumps(record, default=_json_default)
+    return json.dumps(record, default=_json_default).encode('utf-8')
+
+def write_json_sample(path, data):
+    """Write indented JSON in a single buffered write (orjson indents in C when available)"""
+    if orjson:
+        payload = orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, default=_json_default, indent=2).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(payload)
+
+class ProgressLine:
+    """Redraw a single progress line about once a second from a background thread"""
+    
+    def __init__(self, total, label="records", interval=1.0):
+        self.total = total
+        self.label = label
+        self.interval = interval
+        self.completed = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+    
+    def advance(self, count=1):
+        with self._lock:
+            self.completed += count
+    
+    def _render(self):
+        with self._lock:
+            completed = self.completed
+        progress = int((completed / self.total) * 100) if self.total else 100
+        sys.stdout.write(f"\r📊 Progress: {progress}% ({completed}/{self.total} {self.label})")
+        sys.stdout.flush()
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._render()
+    
+    def __enter__(self):
+        self._thread.start()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self._render()
+        return False
 
 def create_s3_bucket_and_upload(medical_records):
-    """Create S3 bucket and upload medical records using configuration"""
-    s3 = boto3.client('s3', region_name=config.region)
+    """Create S3 bucket and upload medical records (iterated once, len() for progress) using configuration"""
+    # One client shared by all upload threads (boto3 clients are thread-safe)
+    s3 = _SESSION.client('s3', region_name=config.region, config=RETRY_CFG)
     bucket_name = config.s3_bucket_name
     
     # Create bucket
@@ -234,23 +414,37 @@ def create_s3_bucket_and_upload(medical_records):
     total_records = len(medical_records)
     print(f"📎 Uploading {total_records} medical records to S3...")
     print(f"⏱️  Estimated time: 1-2 minutes for enterprise data upload")
-    print(f"📊 Progress: ", end="", flush=True)
     
-    for i, record in enumerate(medical_records, 1):
-        key = f"{config.medical_records_prefix}/{record['applicant_id']}/summary.json"
-        # Convert Decimal to float for JSON serialization
-        json_record = decimal_to_float(record)
-        s3.put_object(
-            Bucket=bucket_name,
-            Key=key,
-            Body=json.dumps(json_record),
-            ContentType='application/json'
-        )
+    # One TransferManager queues every upload on its own thread pool and reuses connections
+    transfer_config = TransferConfig(
+        max_concurrency=S3_UPLOAD_WORKERS,
+        multipart_threshold=8 * 1024 * 1024,
+        use_threads=True
+    )
+    with ProgressLine(total_records) as progress, \
+            create_transfer_manager(s3, transfer_config) as transfer_manager:
+        # Bound queued uploads so records stream through instead of all being held at once
+        pending = deque()
+        
+        def wait_oldest():
+            pending.popleft().result()
+            progress.advance()
+        
+        for record in medical_records:
+            key = f"{config.medical_records_prefix}/{record['applicant_id']}/summary.json"
+            # gzip level 1 shrinks the repetitive JSON several-fold for little CPU
+            body = io.BytesIO(gzip.compress(record_to_json_bytes(record), compresslevel=1))
+            pending.append(transfer_manager.upload(
+                body,
+                bucket_name,
+                key,
+                extra_args={'ContentType': 'application/json', 'ContentEncoding': 'gzip'}
+            ))
+            if len(pending) > S3_UPLOAD_WORKERS * 4:
+                wait_oldest()
         
-        # Progress indicator every 100 records
-        if i % 100 == 0 or i == total_records:
-            progress = int((i / total_records) * 100)
-            print(f"\r📊 Progress: {progress}% ({i}/{total_records} records)", end="", flush=True)
+        while pending:
+            wait_oldest()
     
     print(f"\n✅ Successfully uploaded {total_records} medical records to S3")
     print(f"📊 Data organized in: s3://{bucket_name}/medical-records/")
@@ -267,30 +461,37 @@ def main():
     applicants = generate_applicants(1000)
     
     print("🏥 Generating comprehensive medical records for underwriting analysis...")
+    # Medical records stream straight into the S3 upload; only the samples are kept
     medical_records = generate_medical_records(applicants)
+    medical_stream = iter(medical_records)
+    sample_medical_records = list(islice(medical_stream, 10))
     
     print("📋 Generating 500 insurance claims with fraud detection patterns...")
-    claims = generate_claims(500)
+    claims = generate_claims(500, [applicant['applicant_id'] for applicant in applicants])
     
     # Create AWS resources
     print("\n🔄 AWS Infrastructure Setup")
     print("🗺️ Provisioning DynamoDB tables")
     create_dynamodb_tables()
     
+    # DynamoDB and S3 loads are independent, so run them side by side; medical records
+    # are still being generated as the S3 upload consumes them
     print("\n🔄 Data Population (Applicants' profiles and Claims) in DynamoDB")
-    load_data_to_dynamodb(applicants, claims)
-    
-    print("\n🔄 Data Population (Medical records) in S3")
-    create_s3_bucket_and_upload(medical_records)
+    print("🔄 Data Population (Medical records) in S3")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        dynamodb_future = executor.submit(load_data_to_dynamodb, applicants, claims)
+        s3_future = executor.submit(
+            create_s3_bucket_and_upload,
+            SizedIter(chain(sample_medical_records, medical_stream), len(medical_records))
+        )
+        dynamodb_future.result()
+        s3_future.result()
     
-    # Save sample data locally (convert Decimal for JSON)
+    # Save sample data locally
     print("\n🔄 Sample Data Export")
     print("💾 Exporting sample data for development and testing...")
-    with open('sample_applicants.json', 'w') as f:
-        json.dump(decimal_to_float(applicants[:10]), f, indent=2)
-    
-    with open('sample_medical_records.json', 'w') as f:
-        json.dump(decimal_to_float(medical_records[:10]), f, indent=2)
+    write_json_sample('sample_applicants.json', applicants[:10])
+    write_json_sample('sample_medical_records.json', sample_medical_records)
     print("✅ Sample data files created for local development")
     
     print("\n🎉 Completed synthetic data generation.")
@@ -3,18 +3,30 @@
 Insurance Underwriting MCP Server
 """
 
+import asyncio
 import time
 import os
 import json
+import gzip
+import hashlib
 import boto3
-import re
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
 from botocore.config import Config
+from botocore.exceptions import ClientError
 from mcp.server.fastmcp import FastMCP
 from decimal import Decimal
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
 # Try to import config, error out if not found
 try:
-    from config_manager import config
+    from config_manager import config, CLAIMS_APPLICANT_INDEX
 except ImportError:
     import sys
     print("❌ Error: config_manager not found - ensure enterprise_config.yaml is properly configured")
@@ -24,17 +36,25 @@ except ImportError:
 logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
+def _is_prefixed_id(value, prefix: str) -> bool:
+    """True for prefix followed by exactly four ASCII digits (e.g. APP-0001)"""
+    return (type(value) is str and len(value) == 8 and value.startswith(prefix)
+            and value[4:].isascii() and value[4:].isdigit())
+
 def validate_applicant_id(applicant_id: str) -> bool:
     """Validate applicant ID format for security (prevents injection attacks)"""
     # Ensure ID follows exact pattern: APP-XXXX where X is a digit
     # This prevents SQL injection and ensures data integrity
-    return bool(re.match(r'^APP-\d{4}$', applicant_id))
+    return _is_prefixed_id(applicant_id, 'APP-')
 
 def validate_claim_id(claim_id: str) -> bool:
     """Validate claim ID format for security (prevents injection attacks)"""
     # Ensure ID follows exact pattern: CLM-XXXX where X is a digit
     # This prevents SQL injection and ensures data integrity
-    return bool(re.match(r'^CLM-\d{4}$', claim_id))
+    return _is_prefixed_id(claim_id, 'CLM-')
+
+# Nova calls in flight at once (threads and Bedrock connections)
+NOVA_MAX_CONCURRENCY = 16
 
 # Initialize AWS clients for enterprise data access and AI reasoning
 def initialize_aws_clients():
@@ -42,11 +62,18 @@ def initialize_aws_clients():
     try:
         region = config.region
         
+        # Shared by the data clients: a pool large enough for concurrent tool calls,
+        # so warm TCP+TLS connections are reused instead of re-handshaking per request
+        data_config = Config(
+            max_pool_connections=50,
+            tcp_keepalive=True
+        )
+        
         # DynamoDB resource for applicant and claims data access
-        dynamodb = boto3.resource('dynamodb', region_name=region)
+        dynamodb = boto3.resource('dynamodb', region_name=region, config=data_config)
         
         # S3 client for medical records stored as JSON files
-        s3_client = boto3.client('s3', region_name=region)
+        s3_client = boto3.client('s3', region_name=region, config=data_config)
         
         # Bedrock client for Nova AI reasoning with reasonable timeouts
         bedrock_client = boto3.client(
@@ -55,7 +82,9 @@ def initialize_aws_clients():
             config=Config(
                 connect_timeout=60,    # 1 minute connection timeout
                 read_timeout=300,      # 5 minute read timeout for reasoning
-                retries={'max_attempts': 2}  # Two retries for reliability
+                retries={'max_attempts': 2},  # Two retries for reliability
+                tcp_keepalive=True,    # Keep idle connections alive between long calls
+                max_pool_connections=NOVA_MAX_CONCURRENCY
             )
         )
         
@@ -69,44 +98,69 @@ def initialize_aws_clients():
 # Initialize clients
 dynamodb, s3_client, bedrock_client = initialize_aws_clients()
 
+# Table handles are built once and reused by every fetch
+applicants_table = dynamodb.Table(config.applicants_table) if dynamodb else None
+claims_table = dynamodb.Table(config.claims_table) if dynamodb else None
+
 # Initialize FastMCP server
 mcp = FastMCP(host="0.0.0.0", stateless_http=True, json_response=True)
 
 MODEL_ID = config.model_id
 
+# Everything in a Nova request except the messages and system prompt is fixed at startup
+_INFERENCE = config.inference_config
+_BASE_REQUEST = {
+    "modelId": MODEL_ID,  # Amazon Nova model
+    "inferenceConfig": {
+        "temperature": _INFERENCE['temperature'],
+        "topP": _INFERENCE['topP'],
+        "maxTokens": _INFERENCE['maxTokens']
+    },
+    "additionalModelRequestFields": {
+        "reasoningConfig": {
+            "type": "enabled",
+            "maxReasoningEffort": _INFERENCE['maxReasoningEffort']
+        }
+    }
+}
+
+# Blocking boto3 calls run here so independent fetches overlap on the client pool
+_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="mcp-io")
+# Minutes-long Nova calls get their own threads so they never starve the data fetches
+_NOVA_EXECUTOR = ThreadPoolExecutor(max_workers=NOVA_MAX_CONCURRENCY, thread_name_prefix="mcp-nova")
+
+def _in_thread(func, *args, executor=None):
+    """Run a blocking call on the shared executor and return an awaitable"""
+    return asyncio.get_running_loop().run_in_executor(executor or _EXECUTOR, func, *args)
+
 async def nova_reasoning_request(prompt: str, system_prompt: str = None) -> dict:
     """Make a reasoning request to Nova with transparent decision process"""
     try:
         if not bedrock_client:
             logger.error("Bedrock client not initialized")
             return {"error": "AI service unavailable"}
+        
+        # Identical prompts within a few minutes reuse the earlier answer
+        cache_key = hashlib.blake2b(
+            (system_prompt or '').encode() + b'\0' + prompt.encode(), digest_size=16
+        ).digest()
+        cached = _NOVA_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info("Nova reasoning served from cache")
+            return cached
             
         # Format user message for Nova conversation API
         messages = [{"role": "user", "content": [{"text": prompt}]}]
         
-        # Configure Nova request with reasoning enabled
-        request = {
-            "modelId": MODEL_ID,  # Amazon Nova model
-            "messages": messages,
-            "inferenceConfig": {
-                "temperature": config.inference_config['temperature'],
-                "topP": config.inference_config['topP'],
-                "maxTokens": config.inference_config['maxTokens']
-            },
-            "additionalModelRequestFields": {
-                "reasoningConfig": {
-                    "type": "enabled",
-                    "maxReasoningEffort": config.inference_config['maxReasoningEffort']
-                }
-            }
-        }
+        # Configure Nova request with reasoning enabled (shallow copy of the fixed template)
+        request = {**_BASE_REQUEST, "messages": messages}
         
         # Add system prompt if provided (sets context and role for AI)
         if system_prompt:
             request["system"] = [{"text": system_prompt}]
         
-        # Send request to Nova via Bedrock
-        response = bedrock_client.converse(**request)
+        # Send request to Nova via Bedrock without blocking the event loop
+        response = await _in_thread(lambda: bedrock_client.converse(**request), executor=_NOVA_EXECUTOR)
         
         # Extract reasoning process and final response from Nova output
         reasoning_content = ""
@@ -124,11 +178,13 @@ async def nova_reasoning_request(prompt: str, system_prompt: str = None) -> dict
         logger.info("Nova reasoning request completed successfully")
         
         # Return structured response with reasoning transparency
-        return {
+        result = {
             "reasoning": reasoning_content,    # Complete reasoning process
             "response": final_response,       # Final answer/decision
             "usage": response.get('usage', {}) # Token usage for cost tracking
         }
+        _NOVA_CACHE.set(cache_key, result)
+        return result
     except bedrock_client.exceptions.ValidationException as e:
         logger.error(f"Invalid request to Bedrock: {type(e).__name__}")
         return {"error": "Invalid AI request"}
@@ -140,7 +196,7 @@ async def nova_reasoning_request(prompt: str, system_prompt: str = None) -> dict
         return {"error": "AI processing error"}
 
 def decimal_to_float(obj):
-    """Convert Decimal objects to float for JSON serialization"""
+    """Convert Decimal objects to float for records returned in tool responses"""
     if isinstance(obj, Decimal):
         return float(obj)
     elif isinstance(obj, dict):
@@ -149,20 +205,116 @@ def decimal_to_float(obj):
         return [decimal_to_float(v) for v in obj]
     return obj
 
+def _json_default(obj):
+    """Serialize DynamoDB Decimals as floats"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def to_prompt_json(data) -> str:
+    """Render data as compact JSON for embedding in a Nova prompt"""
+    # Indentation carries no meaning for the model but roughly doubles the tokens billed
+    if orjson:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, default=_json_default, separators=(',', ':'))
+
+# Record fields the prompts reason over; identifiers, names and bookkeeping dates stay out
+_APPLICANT_PROMPT_FIELDS = (
+    'age', 'gender', 'occupation', 'income', 'health_status', 'smoker', 'bmi',
+    'exercise_frequency', 'family_history', 'previous_claims', 'credit_score',
+    'marital_status', 'dependents'
+)
+_MEDICAL_PROMPT_FIELDS = (
+    'last_checkup', 'blood_pressure', 'cholesterol', 'weight', 'height',
+    'chronic_conditions', 'medications', 'allergies', 'surgeries', 'hospitalizations'
+)
+_CLAIM_PROMPT_FIELDS = (
+    'claim_type', 'claim_amount', 'policy_limit', 'policy_start_date', 'claim_date',
+    'days_since_policy_start', 'status', 'description', 'fraud_indicators'
+)
+_CLAIM_HISTORY_PROMPT_FIELDS = ('claim_type', 'claim_amount', 'status', 'fraud_indicators')
+
+def projection(fields: tuple) -> dict:
+    """DynamoDB ProjectionExpression kwargs for fields, using placeholders to avoid reserved words"""
+    return {
+        'ProjectionExpression': ', '.join(f'#f{i}' for i in range(len(fields))),
+        'ExpressionAttributeNames': {f'#f{i}': field for i, field in enumerate(fields)}
+    }
+
+def prompt_view(record: dict, fields: tuple) -> dict:
+    """Project a record onto the fields a prompt needs; error results pass through unchanged"""
+    if 'error' in record:
+        return record
+    return {k: record[k] for k in fields if k in record}
+
+def parse_json(payload: bytes):
+    """Parse a JSON document from raw bytes"""
+    return orjson.loads(payload) if orjson else json.loads(payload)
+
+class _TTLCache:
+    """Thread-safe LRU cache whose entries expire ttl seconds after being stored"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+def _cache_success(cache: _TTLCache):
+    """Memoize a single-ID fetch in cache, skipping {"error": ...} results"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(item_id):
+            result = cache.get(item_id)
+            if result is None:
+                result = func(item_id)
+                if 'error' not in result:
+                    cache.set(item_id, result)
+            return result
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+# Tools in one workflow re-fetch the same applicant/claim; keep recent records briefly
+_APPLICANT_CACHE = _TTLCache(maxsize=1024, ttl=60)
+_MEDICAL_CACHE = _TTLCache(maxsize=1024, ttl=60)
+_CLAIM_CACHE = _TTLCache(maxsize=1024, ttl=60)
+# Completed Nova answers keyed by a hash of the system prompt and prompt
+_NOVA_CACHE = _TTLCache(maxsize=512, ttl=300)
+
+@_cache_success(_APPLICANT_CACHE)
 def get_applicant_data(applicant_id: str) -> dict:
     """Get applicant data from DynamoDB"""
     try:
-        if not dynamodb:
-            logger.error("DynamoDB client not initialized")
-            return {"error": "Database service unavailable"}
-        
-        # Input validation for security
+        # Input validation for security (checked first, before any client work)
         if not validate_applicant_id(applicant_id):
             logger.warning(f"Invalid applicant ID format attempted")
             return {"error": "Invalid applicant ID format"}
         
-        table = dynamodb.Table(config.applicants_table)
-        response = table.get_item(Key={'applicant_id': applicant_id})
+        if not applicants_table:
+            logger.error("DynamoDB client not initialized")
+            return {"error": "Database service unavailable"}
+        
+        response = applicants_table.get_item(Key={'applicant_id': applicant_id})
         item = response.get('Item', {})
         
         if not item:
@@ -179,6 +331,7 @@ def get_applicant_data(applicant_id: str) -> dict:
         logger.error(f"Database access error: {type(e).__name__}")
         return {"error": "Database access error"}
 
+@_cache_success(_MEDICAL_CACHE)
 def get_medical_records(applicant_id: str) -> dict:
     """Get medical records from S3"""
     try:
@@ -194,10 +347,14 @@ def get_medical_records(applicant_id: str) -> dict:
         key = f'{config.medical_records_prefix}/{applicant_id}/summary.json'
         
         response = s3_client.get_object(Bucket=bucket_name, Key=key)
-        data = json.loads(response['Body'].read())
-        converted_data = decimal_to_float(data)
+        body = response['Body'].read()
+        # load_data.py uploads gzip-compressed records; older uploads are plain JSON
+        if response.get('ContentEncoding') == 'gzip':
+            body = gzip.decompress(body)
+        # JSON parsing yields floats, so there are no Decimals to convert here
+        data = parse_json(body)
         logger.info("Successfully retrieved medical data")
-        return converted_data
+        return data
     except s3_client.exceptions.NoSuchKey:
         logger.info("Medical records not found for applicant")
         return {"error": "Medical records not found"}
@@ -208,20 +365,20 @@ def get_medical_records(applicant_id: str) -> dict:
         logger.error(f"S3 access error: {type(e).__name__}")
         return {"error": "Medical records access error"}
 
+@_cache_success(_CLAIM_CACHE)
 def get_claim_data(claim_id: str) -> dict:
     """Get claim data from DynamoDB"""
     try:
-        if not dynamodb:
-            logger.error("DynamoDB client not initialized")
-            return {"error": "Database service unavailable"}
-            
-        # Input validation for security
+        # Input validation for security (checked first, before any client work)
         if not validate_claim_id(claim_id):
             logger.warning(f"Invalid claim ID format attempted")
             return {"error": "Invalid claim ID format"}
         
-        table = dynamodb.Table(config.claims_table)
-        response = table.get_item(Key={'claim_id': claim_id})
+        if not claims_table:
+            logger.error("DynamoDB client not initialized")
+            return {"error": "Database service unavailable"}
+        
+        response = claims_table.get_item(Key={'claim_id': claim_id})
         item = response.get('Item', {})
         
         if not item:
@@ -236,24 +393,92 @@ def get_claim_data(claim_id: str) -> dict:
         logger.error(f"Database access error: {type(e).__name__}")
         return {"error": "Database access error"}
 
+# At most this many claims are returned per applicant
+CLAIM_HISTORY_LIMIT = 100
+# Index errors that mean the GSI is missing or not granted, so a scan is the only way to answer
+_INDEX_FALLBACK_ERRORS = ('ValidationException', 'AccessDeniedException')
+# Error codes already logged for the scan fallback, so each cause is warned about once per process
+_INDEX_FALLBACK_LOGGED = set()
+
+def _scan_claim_history(applicant_id: str, projection_args: dict) -> list:
+    """Page through a filtered claims scan until the history limit is reached"""
+    scan_args = {
+        'FilterExpression': boto3.dynamodb.conditions.Attr('applicant_id').eq(applicant_id),
+        **projection_args
+    }
+    items = []
+    while len(items) < CLAIM_HISTORY_LIMIT:
+        response = claims_table.scan(**scan_args)
+        items.extend(response.get('Items', []))
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            break
+        scan_args['ExclusiveStartKey'] = last_key
+    return items[:CLAIM_HISTORY_LIMIT]
+
+def get_claim_history(applicant_id: str) -> list:
+    """Get an applicant's claim history from DynamoDB"""
+    try:
+        # Input validation for security
+        if not validate_applicant_id(applicant_id):
+            logger.warning("Invalid applicant ID format attempted")
+            return []
+        
+        if not claims_table:
+            logger.error("DynamoDB client not initialized for claim history")
+            return []
+        
+        # Use parameterized query for security - applicant_id already validated
+        projection_args = {
+            'ProjectionExpression': 'claim_id, claim_amount, claim_type, #status, fraud_indicators',
+            'ExpressionAttributeNames': {'#status': 'status'}  # Handle reserved keywords
+        }
+        try:
+            items = claims_table.query(
+                IndexName=CLAIMS_APPLICANT_INDEX,
+                KeyConditionExpression=boto3.dynamodb.conditions.Key('applicant_id').eq(applicant_id),
+                Limit=CLAIM_HISTORY_LIMIT,
+                **projection_args
+            ).get('Items', [])
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            # Other errors (e.g. throttling) must not escalate into a full-table scan
+            if error_code not in _INDEX_FALLBACK_ERRORS:
+                raise
+            # Index missing or not granted: scan rather than return no history
+            if error_code not in _INDEX_FALLBACK_LOGGED:
+                _INDEX_FALLBACK_LOGGED.add(error_code)
+                logger.warning(f"Claims index {CLAIMS_APPLICANT_INDEX} unavailable ({error_code}), "
+                               f"scanning claim history")
+            items = _scan_claim_history(applicant_id, projection_args)
+        return [decimal_to_float(item) for item in items]
+    except Exception as e:
+        logger.error("Error getting claim history - database access failed")
+        return []
+
 @mcp.tool()
 async def enterprise_risk_assessment(applicant_id: str) -> dict:
     """Perform enterprise risk assessment using real data and Nova reasoning"""
     try:
-        # Get real applicant data
-        applicant_data = get_applicant_data(applicant_id)
+        # Get real applicant data and medical records concurrently
+        applicant_data, medical_data = await asyncio.gather(
+            _in_thread(get_applicant_data, applicant_id),
+            _in_thread(get_medical_records, applicant_id)
+        )
         if 'error' in applicant_data:
             return {"status": "error", "error": f"Applicant {applicant_id} not found"}
         
-        # Get medical records
-        medical_data = get_medical_records(applicant_id)
-        
         # Prepare comprehensive data for analysis
         comprehensive_data = {
             "applicant": applicant_data,
             "medical": medical_data if 'error' not in medical_data else {}
         }
         
+        prompt_data = {
+            "applicant": prompt_view(applicant_data, _APPLICANT_PROMPT_FIELDS),
+            "medical": prompt_view(comprehensive_data["medical"], _MEDICAL_PROMPT_FIELDS)
+        }
+        
         logger.info(f"Data prepared for risk assessment: {applicant_id}")
         
         system_prompt = """You are an expert insurance underwriter with access to comprehensive applicant data. 
@@ -263,7 +488,7 @@ async def enterprise_risk_assessment(applicant_id: str) -> dict:
         Analyze this comprehensive insurance applicant profile:
         
         APPLICANT DATA:
-        {json.dumps(comprehensive_data, indent=2)}
+        {to_prompt_json(prompt_data)}
         
         This is real data from our enterprise database. Provide detailed analysis.
         
@@ -299,16 +524,19 @@ async def enterprise_risk_assessment(applicant_id: str) -> dict:
 async def enterprise_medical_analysis(applicant_id: str) -> dict:
     """Analyze medical records with enterprise data and deep reasoning"""
     
-    # Get applicant context first
-    applicant_data = get_applicant_data(applicant_id)
+    # Get applicant context and real medical data concurrently
+    applicant_data, medical_data = await asyncio.gather(
+        _in_thread(get_applicant_data, applicant_id),
+        _in_thread(get_medical_records, applicant_id)
+    )
     if 'error' in applicant_data:
         return {"status": "error", "error": f"Applicant {applicant_id} not found"}
     
-    # Get real medical data
-    medical_data = get_medical_records(applicant_id)
-    if 'error' in medical_data:
+    if 'error' not in medical_data:
+        prompt_medical = prompt_view(medical_data, _MEDICAL_PROMPT_FIELDS)
+    else:
         # If no medical records, analyze based on applicant health data
-        medical_data = {
+        medical_data = prompt_medical = {
             "source": "applicant_profile",
             "health_conditions": applicant_data.get('health_conditions', []),
             "smoker": applicant_data.get('smoker', False),
@@ -323,7 +551,7 @@ async def enterprise_medical_analysis(applicant_id: str) -> dict:
     Analyze these medical records for insurance underwriting:
     
     MEDICAL RECORDS:
-    {json.dumps(medical_data, indent=2)}
+    {to_prompt_json(prompt_medical)}
     
     APPLICANT CONTEXT:
     Age: {applicant_data.get('age', 'Unknown')}
@@ -358,13 +586,14 @@ async def enterprise_medical_analysis(applicant_id: str) -> dict:
 async def enterprise_fraud_detection(claim_id: str) -> dict:
     """Detect fraud using real claim data and Nova reasoning"""
     
-    # Get real claim data
-    claim_data = get_claim_data(claim_id)
+    # Get real claim data; the applicant lookup depends on it, so the two stay sequential
+    # but run off the event loop (and usually hit the fetch caches on repeat calls)
+    claim_data = await _in_thread(get_claim_data, claim_id)
     if 'error' in claim_data:
         return {"status": "error", "error": f"Claim {claim_id} not found"}
     
     # Get applicant context
-    applicant_data = get_applicant_data(claim_data.get('applicant_id', ''))
+    applicant_data = await _in_thread(get_applicant_data, claim_data.get('applicant_id', ''))
     
     system_prompt = """You are a fraud detection specialist with access to comprehensive claim and applicant data. 
     Analyze for potential fraudulent activity using pattern recognition."""
@@ -373,10 +602,10 @@ async def enterprise_fraud_detection(claim_id: str) -> dict:
     Analyze this insurance claim for potential fraud:
     
     CLAIM DATA:
-    {json.dumps(claim_data, indent=2)}
+    {to_prompt_json(prompt_view(claim_data, _CLAIM_PROMPT_FIELDS))}
     
     APPLICANT PROFILE:
-    {json.dumps(applicant_data, indent=2)}
+    {to_prompt_json(prompt_view(applicant_data, _APPLICANT_PROMPT_FIELDS))}
     
     Evaluate comprehensively:
     1. Claim timing analysis
@@ -407,32 +636,15 @@ async def enterprise_fraud_detection(claim_id: str) -> dict:
 async def enterprise_underwriting_decision(applicant_id: str, policy_type: str, coverage_amount: float) -> dict:
     """Make comprehensive underwriting decision using all enterprise data"""
     
-    # Get all relevant data
-    applicant_data = get_applicant_data(applicant_id)
+    # Get all relevant data concurrently
+    applicant_data, medical_data, claim_history = await asyncio.gather(
+        _in_thread(get_applicant_data, applicant_id),
+        _in_thread(get_medical_records, applicant_id),
+        _in_thread(get_claim_history, applicant_id)
+    )
     if 'error' in applicant_data:
         return {"status": "error", "error": f"Applicant {applicant_id} not found"}
     
-    medical_data = get_medical_records(applicant_id)
-    
-    # Get applicant's claim history with validation
-    try:
-        if not dynamodb:
-            logger.error("DynamoDB client not initialized for claim history")
-            claim_history = []
-        else:
-            claims_table = dynamodb.Table(config.claims_table)
-            # Use parameterized query for security - applicant_id already validated
-            claims_response = claims_table.scan(
-                FilterExpression=boto3.dynamodb.conditions.Attr('applicant_id').eq(applicant_id),
-                Limit=100,  # Limit results for performance
-                ProjectionExpression='claim_id, claim_amount, claim_type, #status, fraud_indicators',
-                ExpressionAttributeNames={'#status': 'status'}  # Handle reserved keywords
-            )
-            claim_history = [decimal_to_float(item) for item in claims_response.get('Items', [])]
-    except Exception as e:
-        logger.error("Error getting claim history - database access failed")
-        claim_history = []
-    
     comprehensive_data = {
         "applicant": applicant_data,
         "medical": medical_data if 'error' not in medical_data else {},
@@ -443,6 +655,13 @@ async def enterprise_underwriting_decision(applicant_id: str, policy_type: str,
         }
     }
     
+    prompt_data = {
+        "applicant": prompt_view(applicant_data, _APPLICANT_PROMPT_FIELDS),
+        "medical": prompt_view(comprehensive_data["medical"], _MEDICAL_PROMPT_FIELDS),
+        "claim_history": [prompt_view(claim, _CLAIM_HISTORY_PROMPT_FIELDS) for claim in claim_history],
+        "requested_policy": comprehensive_data["requested_policy"]
+    }
+    
     system_prompt = """You are a senior underwriter making final approval decisions. 
     Consider all available data, risk factors, and company policies to make informed decisions."""
     
@@ -450,7 +669,7 @@ async def enterprise_underwriting_decision(applicant_id: str, policy_type: str,
     Make a comprehensive underwriting decision for this application:
     
     COMPLETE APPLICATION DATA:
-    {json.dumps(comprehensive_data, indent=2)}
+    {to_prompt_json(prompt_data)}
     
     Provide detailed decision including:
     1. Final decision (Approve/Decline/Conditional Approval)
@@ -480,53 +699,83 @@ async def enterprise_underwriting_decision(applicant_id: str, policy_type: str,
         }
     }
 
+# Parallel scan width for the analytics tool and the attributes it sums
+ANALYTICS_SCAN_SEGMENTS = 8
+_APPLICANT_METRIC_FIELDS = ('age', 'income')
+_CLAIM_METRIC_FIELDS = ('claim_amount',)
+
+def _sum_segment(table, segment: int, fields: tuple) -> list:
+    """Scan one parallel-scan segment projected to fields; return [item count, sum of each field]"""
+    kwargs = {
+        'Segment': segment,
+        'TotalSegments': ANALYTICS_SCAN_SEGMENTS,
+        **projection(fields)
+    }
+    # Pages are folded into the totals as they arrive, so memory stays flat as tables grow
+    totals = [0] * (len(fields) + 1)
+    while True:
+        response = table.scan(**kwargs)
+        items = response.get('Items', [])
+        totals[0] += len(items)
+        # Column-wise sums per page; int() accepts DynamoDB's Decimal directly
+        for i, field in enumerate(fields, 1):
+            totals[i] += sum(int(item.get(field, 0)) for item in items)
+        
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return totals
+        kwargs['ExclusiveStartKey'] = last_key
+
+def _count_segment(table, segment: int, condition) -> int:
+    """Count the items in one parallel-scan segment that match condition, server side"""
+    kwargs = {
+        'Segment': segment,
+        'TotalSegments': ANALYTICS_SCAN_SEGMENTS,
+        'Select': 'COUNT',
+        'FilterExpression': condition
+    }
+    count = 0
+    while True:
+        response = table.scan(**kwargs)
+        count += response.get('Count', 0)
+        
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return count
+        kwargs['ExclusiveStartKey'] = last_key
+
+def _gather_segments(func, table, arg):
+    """Run func over every parallel-scan segment of table concurrently"""
+    return asyncio.gather(*(_in_thread(func, table, segment, arg) for segment in range(ANALYTICS_SCAN_SEGMENTS)))
+
 @mcp.tool()
 async def enterprise_analytics() -> dict:
     """Generate enterprise analytics using real data"""
     
     try:
-        # Get applicant statistics with pagination for performance
-        applicants_table = dynamodb.Table(config.applicants_table)
-        applicants = []
-        last_key = None
-        
-        while True:
-            if last_key:
-                response = applicants_table.scan(ExclusiveStartKey=last_key, Limit=100)
-            else:
-                response = applicants_table.scan(Limit=100)
-            
-            applicants.extend([decimal_to_float(item) for item in response.get('Items', [])])
-            
-            last_key = response.get('LastEvaluatedKey')
-            if not last_key:
-                break
-        
-        # Get claims statistics with pagination for performance
-        claims_table = dynamodb.Table(config.claims_table)
-        claims = []
-        last_key = None
-        
-        while True:
-            if last_key:
-                response = claims_table.scan(ExclusiveStartKey=last_key, Limit=100)
-            else:
-                response = claims_table.scan(Limit=100)
-            
-            claims.extend([decimal_to_float(item) for item in response.get('Items', [])])
-            
-            last_key = response.get('LastEvaluatedKey')
-            if not last_key:
-                break
+        # Scan both tables as parallel segments, fetching only the attributes the averages use;
+        # the smoker and high-risk counts are filtered and counted by DynamoDB itself
+        Attr = boto3.dynamodb.conditions.Attr
+        applicant_segments, claim_segments, smoker_counts, high_risk_counts = await asyncio.gather(
+            _gather_segments(_sum_segment, applicants_table, _APPLICANT_METRIC_FIELDS),
+            _gather_segments(_sum_segment, claims_table, _CLAIM_METRIC_FIELDS),
+            _gather_segments(_count_segment, applicants_table, Attr('smoker').eq(True)),
+            _gather_segments(_count_segment, claims_table, Attr('fraud_indicators').gt(3))
+        )
+        # Combine the per-segment partial sums
+        applicant_count, age_total, income_total = map(sum, zip(*applicant_segments))
+        claim_count, claim_total = map(sum, zip(*claim_segments))
+        smoker_count = sum(smoker_counts)
+        high_risk_count = sum(high_risk_counts)
         
         analytics_data = {
-            "total_applicants": len(applicants),
-            "total_claims": len(claims),
-            "avg_age": sum(int(a.get('age', 0)) for a in applicants) / len(applicants) if applicants else 0,
-            "avg_income": sum(int(a.get('income', 0)) for a in applicants) / len(applicants) if applicants else 0,
-            "smoker_percentage": len([a for a in applicants if a.get('smoker')]) / len(applicants) * 100 if applicants else 0,
-            "avg_claim_amount": sum(int(c.get('claim_amount', 0)) for c in claims) / len(claims) if claims else 0,
-            "high_risk_claims": len([c for c in claims if int(c.get('fraud_indicators', 0)) > 3])
+            "total_applicants": applicant_count,
+            "total_claims": claim_count,
+            "avg_age": age_total / applicant_count if applicant_count else 0,
+            "avg_income": income_total / applicant_count if applicant_count else 0,
+            "smoker_percentage": smoker_count / applicant_count * 100 if applicant_count else 0,
+            "avg_claim_amount": claim_total / claim_count if claim_count else 0,
+            "high_risk_claims": high_risk_count
         }
         
         system_prompt = """You are a business intelligence analyst. Analyze insurance portfolio data and provide insights."""
@@ -535,7 +784,7 @@ async def enterprise_analytics() -> dict:
         Analyze this insurance portfolio data:
         
         PORTFOLIO ANALYTICS:
-        {json.dumps(analytics_data, indent=2)}
+        {to_prompt_json(analytics_data)}
         
         Provide comprehensive analysis:
         1. Portfolio health assessment
@@ -563,9 +812,33 @@ async def enterprise_analytics() -> dict:
         logger.error(f"Analytics error: {type(e).__name__}")
         return {"status": "error", "error": "Analytics processing failed"}
 
+# Health probes call control-plane APIs; a healthy report is reused for this many seconds
+HEALTH_CACHE_TTL = 30
+_HEALTH_CACHE = {'ts': 0.0, 'val': None}
+
+def _table_status(table_name: str) -> str:
+    """Current status of a DynamoDB table"""
+    return dynamodb.meta.client.describe_table(TableName=table_name)['Table']['TableStatus']
+
+def _bucket_status() -> str:
+    """Confirm the medical records bucket is reachable"""
+    s3_client.head_bucket(Bucket=config.s3_bucket_name)
+    return "accessible"
+
 @mcp.tool()
 async def health_check() -> dict:
     """Health check for Insurance Underwriting MCP Server"""
+    cached = _HEALTH_CACHE['val']
+    if cached is not None and time.monotonic() - _HEALTH_CACHE['ts'] < HEALTH_CACHE_TTL:
+        # Hand back a copy stamped with the current time; checked_at keeps the original probe time
+        return {
+            **cached,
+            "data_sources": dict(cached["data_sources"]),
+            "timestamp": time.time(),
+            "cached": True,
+            "checked_at": cached["timestamp"]
+        }
+    
     health_status = {
         "status": "healthy",
         "model": MODEL_ID,
@@ -576,41 +849,34 @@ async def health_check() -> dict:
     }
     
     errors = []
+    # (data source, failure message, blocking probe) for every client that is available
+    probes = []
     
     # Check DynamoDB clients
     if not dynamodb:
         errors.append("DynamoDB client not initialized")
         health_status["data_sources"]["dynamodb"] = "unavailable"
     else:
-        # Test applicants table
-        try:
-            applicants_table = dynamodb.Table(config.applicants_table)
-            applicants_desc = applicants_table.meta.client.describe_table(TableName=config.applicants_table)
-            health_status["data_sources"]["dynamodb_applicants"] = applicants_desc['Table']['TableStatus']
-        except Exception as e:
-            errors.append("Applicants table access failed")
-            health_status["data_sources"]["dynamodb_applicants"] = "error"
-        
-        # Test claims table
-        try:
-            claims_table = dynamodb.Table(config.claims_table)
-            claims_desc = claims_table.meta.client.describe_table(TableName=config.claims_table)
-            health_status["data_sources"]["dynamodb_claims"] = claims_desc['Table']['TableStatus']
-        except Exception as e:
-            errors.append("Claims table access failed")
-            health_status["data_sources"]["dynamodb_claims"] = "error"
+        probes.append(("dynamodb_applicants", "Applicants table access failed",
+                       lambda: _table_status(config.applicants_table)))
+        probes.append(("dynamodb_claims", "Claims table access failed",
+                       lambda: _table_status(config.claims_table)))
     
     # Check S3 client and bucket
     if not s3_client:
         errors.append("S3 client not initialized")
         health_status["data_sources"]["s3_bucket"] = "unavailable"
     else:
-        try:
-            s3_client.head_bucket(Bucket=config.s3_bucket_name)
-            health_status["data_sources"]["s3_bucket"] = "accessible"
-        except Exception as e:
-            errors.append("S3 bucket access failed")
-            health_status["data_sources"]["s3_bucket"] = "error"
+        probes.append(("s3_bucket", "S3 bucket access failed", _bucket_status))
+    
+    # Run the table and bucket probes concurrently
+    results = await asyncio.gather(*(_in_thread(probe) for _, _, probe in probes), return_exceptions=True)
+    for (source, failure, _), result in zip(probes, results):
+        if isinstance(result, Exception):
+            errors.append(failure)
+            health_status["data_sources"][source] = "error"
+        else:
+            health_status["data_sources"][source] = result
     
     # Check Bedrock client
     if not bedrock_client:
@@ -624,6 +890,10 @@ async def health_check() -> dict:
         health_status["status"] = "unhealthy"
         health_status["errors"] = errors
     
+    # Failures are never cached, so recovery shows up on the next check
+    if not errors:
+        _HEALTH_CACHE['ts'] = time.monotonic()
+        _HEALTH_CACHE['val'] = health_status
     return health_status
 
 if __name__ == "__main__":
@@ -7,56 +7,121 @@ import json
 import boto3
 import requests
 import urllib.parse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import sys
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'deployment'))
 from config_manager import config
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
 # Configure secure logging
 logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
-def get_oauth_token():
-    """Get JWT token from Cognito for MCP server authentication"""
+# One boto3 session for the whole run; clients are built once per service
+_BOTO_SESSION = boto3.Session()
+_REGION = _BOTO_SESSION.region_name
+# boto3 sessions are not thread-safe, so client creation is serialized
+_BOTO_LOCK = threading.Lock()
+
+@lru_cache(maxsize=None)
+def _client(service_name):
+    """Return a shared boto3 client per service (client creation parses service models)"""
+    with _BOTO_LOCK:
+        return _BOTO_SESSION.client(service_name, region_name=_REGION)
+
+@lru_cache(maxsize=1)
+def _dynamodb():
+    """Return the shared DynamoDB resource"""
+    with _BOTO_LOCK:
+        return _BOTO_SESSION.resource('dynamodb', region_name=_REGION)
+
+# One keep-alive session for Cognito and every MCP call, so TLS handshakes happen once per host.
+# Gateway errors are retried on the pooled connections (the MCP tools are all read-only).
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {'POST'}
+    )
+))
+
+# The configured MCP runtime's id, ARN and get_agent_runtime details, looked up once
+_RUNTIME_CACHE = {}
+
+def _resolve_runtime(agentcore_client):
+    """Find the configured MCP server runtime in AgentCore (cached after the first lookup)"""
+    if _RUNTIME_CACHE:
+        return _RUNTIME_CACHE
+    
+    # Page through runtimes, stopping as soon as the configured server is found
+    paginator = agentcore_client.get_paginator('list_agent_runtimes')
+    match = next(
+        (runtime
+         for page in paginator.paginate(PaginationConfig={'PageSize': 100})
+         for runtime in page.get('agentRuntimes', [])
+         if runtime['agentRuntimeName'] == config.mcp_server_name),
+        None
+    )
+    
+    if not match:
+        raise Exception(f"MCP server '{config.mcp_server_name}' not found in AgentCore")
+    
+    runtime_details = agentcore_client.get_agent_runtime(
+        agentRuntimeId=match['agentRuntimeId'],
+        agentRuntimeVersion='1'
+    )
+    
+    _RUNTIME_CACHE.update(
+        runtime_id=match['agentRuntimeId'],
+        runtime_arn=match['agentRuntimeArn'],
+        details=runtime_details
+    )
+    return _RUNTIME_CACHE
+
+# Cognito access token, reused until a minute before it expires
+_TOKEN_CACHE = {'token': None, 'expires_at': 0}
+_TOKEN_LOCK = threading.Lock()
+
+def get_oauth_token(runtime_details):
+    """Get JWT token for MCP server authentication, fetching a new one only near expiry"""
+    # Holding the lock while fetching keeps concurrent callers from racing to Cognito
+    with _TOKEN_LOCK:
+        if _TOKEN_CACHE['token'] and time.time() < _TOKEN_CACHE['expires_at']:
+            return _TOKEN_CACHE['token']
+        
+        fetched = _request_oauth_token(runtime_details)
+        if not fetched:
+            return None
+        token, expires_in = fetched
+        _TOKEN_CACHE['token'] = token
+        _TOKEN_CACHE['expires_at'] = time.time() + expires_in - 60
+        return token
+
+def _request_oauth_token(runtime_details):
+    """Request a JWT from Cognito; returns (access_token, expires_in) or None"""
     try:
-        region = boto3.Session().region_name
-        agentcore_client = boto3.client('bedrock-agentcore-control', region_name=region)
-        cognito_client = boto3.client('cognito-idp', region_name=region)
-        
-        # Get runtime details from AgentCore API with pagination
-        agent_runtime_id = None
-        next_token = None
-        
-        while True:
-            if next_token:
-                response = agentcore_client.list_agent_runtimes(nextToken=next_token)
-            else:
-                response = agentcore_client.list_agent_runtimes()
-            
-            for runtime in response.get('agentRuntimes', []):
-                if runtime['agentRuntimeName'] == config.mcp_server_name:
-                    agent_runtime_id = runtime['agentRuntimeId']
-                    break
-            
-            if agent_runtime_id or 'nextToken' not in response:
-                break
-            next_token = response['nextToken']
-        
-        if not agent_runtime_id:
-            raise Exception(f"MCP server '{config.mcp_server_name}' not found")
+        region = runtime_details['region']
+        cognito_client = _client('cognito-idp')
         
-        runtime_details = agentcore_client.get_agent_runtime(
-            agentRuntimeId=agent_runtime_id,
-            agentRuntimeVersion='1'
-        )
-        
-        # Extract Cognito config from AgentCore
-        auth_config = runtime_details.get('authorizerConfiguration', {})
-        jwt_auth = auth_config.get('customJWTAuthorizer', {})
-        discovery_url = jwt_auth.get('discoveryUrl', '')
-        client_id = jwt_auth.get('allowedClients', [''])[0]
+        # Cognito config as already read from AgentCore by get_complete_runtime_details
+        discovery_url = runtime_details['discovery_url']
+        client_id = (runtime_details['allowed_clients'] or [''])[0]
         
         # Extract pool ID from discovery URL
         if discovery_url and 'amazonaws.com/' in discovery_url:
@@ -64,15 +129,17 @@ def get_oauth_token():
         else:
             raise Exception("Could not extract Cognito pool ID from AgentCore")
         
-        # Get client secret directly from Cognito
-        client_response = cognito_client.describe_user_pool_client(
-            UserPoolId=pool_id,
-            ClientId=client_id
-        )
+        # Get client secret and token endpoint domain from Cognito concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            client_future = executor.submit(
+                cognito_client.describe_user_pool_client,
+                UserPoolId=pool_id,
+                ClientId=client_id
+            )
+            pool_future = executor.submit(cognito_client.describe_user_pool, UserPoolId=pool_id)
+            client_response = client_future.result()
+            pool_response = pool_future.result()
         client_secret = client_response['UserPoolClient'].get('ClientSecret')
-        
-        # Get domain for token endpoint from user pool
-        pool_response = cognito_client.describe_user_pool(UserPoolId=pool_id)
         domain = pool_response['UserPool'].get('Domain')
         
         if domain:
@@ -89,7 +156,7 @@ def get_oauth_token():
             'grant_type': 'client_credentials'
         }
         
-        token_response = requests.post(
+        token_response = _SESSION.post(
             token_endpoint, 
             headers=headers, 
             data=data,
@@ -97,7 +164,8 @@ def get_oauth_token():
         )
         token_response.raise_for_status()
         
-        return token_response.json()['access_token']
+        token_body = token_response.json()
+        return token_body['access_token'], token_body.get('expires_in', 3600)
         
     except requests.exceptions.RequestException as e:
         logger.error(f"OAuth request failed: {type(e).__name__}")
@@ -106,84 +174,66 @@ def get_oauth_token():
         logger.error(f"Failed to get JWT token: {type(e).__name__}")
         return None
 
-def get_runtime_details():
-    """Get complete runtime details from AgentCore API"""
+def _parallel_scan_first(table, key_name, total_segments=8):
+    """Return the first item found by a parallel Limit=1 scan over all segments (key only), or None"""
+    executor = ThreadPoolExecutor(max_workers=total_segments)
     try:
-        region = boto3.Session().region_name
-        agentcore_client = boto3.client('bedrock-agentcore-control', region_name=region)
-        
-        # Find matching runtime
-        agent_runtime_id = None
-        agent_arn = None
-        next_token = None
-        
-        while True:
-            if next_token:
-                response = agentcore_client.list_agent_runtimes(nextToken=next_token)
-            else:
-                response = agentcore_client.list_agent_runtimes()
-            
-            for runtime in response.get('agentRuntimes', []):
-                if runtime['agentRuntimeName'] == config.mcp_server_name:
-                    agent_runtime_id = runtime['agentRuntimeId']
-                    agent_arn = runtime['agentRuntimeArn']
-                    break
-            
-            if agent_runtime_id or 'nextToken' not in response:
-                break
-            next_token = response['nextToken']
-        
-        if not agent_runtime_id:
-            raise Exception(f"MCP server '{config.mcp_server_name}' not found in AgentCore")
-        
-        # Build endpoint
-        encoded_arn = urllib.parse.quote(agent_arn, safe='')
-        endpoint = f"https://bedrock-agentcore.{region}.amazonaws.com/runtimes/{encoded_arn}/invocations?qualifier=DEFAULT"
-        
-        return {
-            'server_name': config.mcp_server_name,
-            'runtime_id': agent_runtime_id,
-            'endpoint': endpoint,
-            'region': region
-        }
-        
-    except Exception as e:
-        logger.error(f"Failed to get runtime details: {e}")
+        futures = [
+            executor.submit(table.scan, Segment=segment, TotalSegments=total_segments,
+                            Limit=1, ProjectionExpression=key_name)
+            for segment in range(total_segments)
+        ]
+        for future in as_completed(futures):
+            items = future.result().get('Items', [])
+            if items:
+                return items[0]
         return None
+    finally:
+        # Don't wait on the remaining segments once an item has been found
+        executor.shutdown(wait=False, cancel_futures=True)
 
 def get_sample_data():
     """Get sample applicant and claim IDs"""
     try:
-        dynamodb = boto3.resource('dynamodb')
-        
-        # Get sample applicant
+        dynamodb = _dynamodb()
         applicants_table = dynamodb.Table(config.applicants_table)
-        applicants_response = applicants_table.scan(Limit=1)
-        applicants = applicants_response.get('Items', [])
-        
-        # Get sample claim
         claims_table = dynamodb.Table(config.claims_table)
-        claims_response = claims_table.scan(Limit=1)
-        claims = claims_response.get('Items', [])
         
-        if not applicants or not claims:
+        # Find one sample applicant and one sample claim concurrently, fetching only their keys
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            applicant_future = executor.submit(_parallel_scan_first, applicants_table, 'applicant_id')
+            claim_future = executor.submit(_parallel_scan_first, claims_table, 'claim_id')
+            applicant = applicant_future.result()
+            claim = claim_future.result()
+        
+        if not applicant or not claim:
             raise Exception("No sample data found")
             
-        return applicants[0]['applicant_id'], claims[0]['claim_id']
+        return applicant['applicant_id'], claim['claim_id']
         
     except Exception as e:
         raise Exception(f"Failed to get sample data: {type(e).__name__}")
 
+def parse_json(payload):
+    """Parse JSON from bytes or str"""
+    return orjson.loads(payload) if orjson else json.loads(payload)
+
+def dump_json(data):
+    """Encode data as UTF-8 JSON bytes"""
+    return orjson.dumps(data) if orjson else json.dumps(data).encode('utf-8')
+
+# Headers shared by every MCP call; only the bearer token varies
+_MCP_HEADERS = {
+    'Content-Type': 'application/json',
+    'Accept': 'application/json, text/event-stream'
+}
+
 def test_mcp_tool(endpoint, token, tool_name, arguments=None):
     """Test MCP tool"""
     if arguments is None:
         arguments = {}
     
-    headers = {
-        'Authorization': f'Bearer {token}',
-        'Content-Type': 'application/json',
-        'Accept': 'application/json, text/event-stream'
-    }
+    headers = {**_MCP_HEADERS, 'Authorization': f'Bearer {token}'}
     
     payload = {
         "jsonrpc": "2.0",
@@ -196,31 +246,48 @@ def test_mcp_tool(endpoint, token, tool_name, arguments=None):
     }
     
     try:
-        response = requests.post(endpoint, headers=headers, json=payload, timeout=180)
-        response.raise_for_status()
-        
-        content = response.text
-        if content.startswith('data: '):
-            data_line = content.split('\n')[0][6:]
-            result = json.loads(data_line)
-            return result.get('result', {})
+        with _SESSION.post(endpoint, headers=headers, data=dump_json(payload), timeout=180, stream=True) as response:
+            response.raise_for_status()
+            
+            # SSE responses are parsed from the first data frame as it arrives
+            if 'text/event-stream' in response.headers.get('Content-Type', ''):
+                for line in response.iter_lines(decode_unicode=True):
+                    if line and line.startswith('data: '):
+                        result = parse_json(line[6:])
+                        if not isinstance(result, dict) or not isinstance(result.get('result', {}), dict):
+                            return {"error": "Unexpected SSE payload shape", "status": "failed"}
+                        return result.get('result', {})
+                # The stream is consumed at this point, so response.content cannot be read
+                return {"error": "No data frame in SSE response", "status": "failed"}
+            
+            result = parse_json(response.content)
         
-        result = response.json()
+        if not isinstance(result, dict):
+            return {"error": "Unexpected response payload shape", "status": "failed"}
         
         # Handle MCP JSON-RPC response format
-        if 'result' in result and 'content' in result['result']:
+        if isinstance(result.get('result'), dict) and 'content' in result['result']:
             content = result['result']['content']
-            if content and len(content) > 0 and 'text' in content[0]:
-                tool_result = json.loads(content[0]['text'])
+            if content and isinstance(content[0], dict) and 'text' in content[0]:
+                tool_result = parse_json(content[0]['text'])
+                if not isinstance(tool_result, dict):
+                    return {"error": "Unexpected tool result shape", "status": "failed"}
                 return tool_result
         
         return result
         
-    except Exception as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
+        # ValueError covers JSON decode errors from both json and orjson
         return {"error": str(e), "status": "failed"}
 
+def tool_succeeded(tool_name, result):
+    """Whether a tool call returned a successful result"""
+    # health_check reports "healthy"; every other tool reports "success"
+    expected = 'healthy' if tool_name == 'health_check' else 'success'
+    return isinstance(result, dict) and result.get('status') == expected
+
 def test_all_tools(endpoint, token, sample_applicant, sample_claim):
-    """Test all 6 MCP server tools"""
+    """Test all 6 MCP server tools; returns each tool's full result keyed by tool name"""
     tools_to_test = [
         {
             "name": "health_check",
@@ -263,69 +330,48 @@ def test_all_tools(endpoint, token, sample_applicant, sample_claim):
     print(f"🛠️ Testing {len(tools_to_test)} MCP Tools:")
     print()
     
-    results = {}
-    for tool in tools_to_test:
-        print(f"{tool['icon']} Testing {tool['name']}... ({tool['description']})")
-        
-        result = test_mcp_tool(endpoint, token, tool['name'], tool['args'])
-        
-        # Special handling for health_check tool
-        if tool['name'] == 'health_check':
-            if result and result.get('status') == 'healthy':
-                print(f"   ✅ Success")
-                results[tool['name']] = 'success'
-            else:
-                error_msg = result.get('error', 'Unknown error') if result else 'No response'
-                print(f"   ❌ Failed: {error_msg}")
-                results[tool['name']] = 'failed'
-        else:
-            # Standard handling for other tools
-            if result and result.get('status') == 'success':
+    # The calls are independent, so run them all at once and report in the listed order
+    with ThreadPoolExecutor(max_workers=len(tools_to_test)) as executor:
+        futures = [executor.submit(test_mcp_tool, endpoint, token, tool['name'], tool['args'])
+                   for tool in tools_to_test]
+        
+        results = {}
+        for tool, future in zip(tools_to_test, futures):
+            print(f"{tool['icon']} Testing {tool['name']}... ({tool['description']})")
+            
+            result = future.result()
+            results[tool['name']] = result
+            
+            if tool_succeeded(tool['name'], result):
                 print(f"   ✅ Success")
-                results[tool['name']] = 'success'
             else:
                 error_msg = result.get('error', 'Unknown error') if result else 'No response'
                 print(f"   ❌ Failed: {error_msg}")
-                results[tool['name']] = 'failed'
-        print()
+            print()
     
     return results
 
+def warm_connection(endpoint):
+    """Open the keep-alive connection (DNS, TCP and TLS) to the endpoint before the timed calls"""
+    try:
+        # Any HTTP status will do; only the pooled connection matters
+        _SESSION.head(endpoint, timeout=5).close()
+        return True
+    except requests.exceptions.RequestException as e:
+        logger.warning(f"Endpoint warm-up failed: {type(e).__name__}")
+        return False
+
 def get_complete_runtime_details():
     """Get complete runtime details from AgentCore API"""
     try:
-        region = boto3.Session().region_name
-        agentcore_client = boto3.client('bedrock-agentcore-control', region_name=region)
-        
-        # Find matching runtime
-        agent_runtime_id = None
-        agent_arn = None
-        next_token = None
+        region = _REGION
+        agentcore_client = _client('bedrock-agentcore-control')
         
-        while True:
-            if next_token:
-                response = agentcore_client.list_agent_runtimes(nextToken=next_token)
-            else:
-                response = agentcore_client.list_agent_runtimes()
-            
-            for runtime in response.get('agentRuntimes', []):
-                if runtime['agentRuntimeName'] == config.mcp_server_name:
-                    agent_runtime_id = runtime['agentRuntimeId']
-                    agent_arn = runtime['agentRuntimeArn']
-                    break
-            
-            if agent_runtime_id or 'nextToken' not in response:
-                break
-            next_token = response['nextToken']
-        
-        if not agent_runtime_id:
-            raise Exception(f"MCP server '{config.mcp_server_name}' not found in AgentCore")
-        
-        # Get detailed runtime info
-        runtime_details = agentcore_client.get_agent_runtime(
-            agentRuntimeId=agent_runtime_id,
-            agentRuntimeVersion='1'
-        )
+        # Find matching runtime and its detailed info
+        runtime = _resolve_runtime(agentcore_client)
+        agent_runtime_id = runtime['runtime_id']
+        agent_arn = runtime['runtime_arn']
+        runtime_details = runtime['details']
         
         # Extract auth config
         auth_config = runtime_details.get('authorizerConfiguration', {})
@@ -366,11 +412,13 @@ def main():
     print(f"   Endpoint: {runtime_details['endpoint']}")
     print(f"   Auth Discovery: {runtime_details['discovery_url']}")
     print(f"   Region: {runtime_details['region']}")
+    if not warm_connection(runtime_details['endpoint']):
+        print("⚠️ Could not reach the runtime endpoint - tool calls may fail")
     print()
     
     # Get OAuth credentials
     print("🔐 Getting OAuth credentials...")
-    token = get_oauth_token()
+    token = get_oauth_token(runtime_details)
     if not token:
         print("❌ Failed to get OAuth token")
         return
@@ -398,7 +446,7 @@ def main():
     # Summary
     print("="*70)
     print("📊 TEST SUMMARY:")
-    successful = sum(1 for r in results.values() if r == 'success')
+    successful = sum(1 for name, r in results.items() if tool_succeeded(name, r))
     total = len(results)
     failed = total - successful
     print(f"   ✅ Successful: {successful}/{total} tools")
@@ -419,8 +467,9 @@ def main():
         print("🎯 FUNCTIONAL TESTS - UNDERWRITING USE CASE")
         print("="*70)
         
+        # Reuse the results already returned by the tool validation run above
         print("\n🔍 Test 1: Risk Assessment with Reasoning")
-        risk_result = test_mcp_tool(runtime_details['endpoint'], token, "enterprise_risk_assessment", {"applicant_id": sample_applicant})
+        risk_result = results['enterprise_risk_assessment']
         if risk_result and risk_result.get('status') == 'success':
             print("   ✅ Success")
             data = risk_result.get('data', {})
@@ -434,7 +483,7 @@ def main():
             print("   ❌ Failed")
         
         print("\n🏥 Test 2: Medical Analysis")
-        medical_result = test_mcp_tool(runtime_details['endpoint'], token, "enterprise_medical_analysis", {"applicant_id": sample_applicant})
+        medical_result = results['enterprise_medical_analysis']
         if medical_result and medical_result.get('status') == 'success':
             print("   ✅ Success")
             data = medical_result.get('data', {})
@@ -445,7 +494,7 @@ def main():
             print("   ❌ Failed")
         
         print("\n⚠️ Test 3: Fraud Detection")
-        fraud_result = test_mcp_tool(runtime_details['endpoint'], token, "enterprise_fraud_detection", {"claim_id": sample_claim})
+        fraud_result = results['enterprise_fraud_detection']
         if fraud_result and fraud_result.get('status') == 'success':
             print("   ✅ Success")
             data = fraud_result.get('data', {})
@@ -456,11 +505,7 @@ def main():
             print("   ❌ Failed")
         
         print("\n⚖️ Test 4: Underwriting Decision")
-        decision_result = test_mcp_tool(runtime_details['endpoint'], token, "enterprise_underwriting_decision", {
-            "applicant_id": sample_applicant,
-            "policy_type": "life",
-            "coverage_amount": 500000
-        })
+        decision_result = results['enterprise_underwriting_decision']
         if decision_result and decision_result.get('status') == 'success':
             print("   ✅ Success")
             data = decision_result.get('data', {})
@@ -471,7 +516,7 @@ def main():
             print("   ❌ Failed")
         
         print("\n📊 Test 5: Portfolio Analytics")
-        analytics_result = test_mcp_tool(runtime_details['endpoint'], token, "enterprise_analytics")
+        analytics_result = results['enterprise_analytics']
         if analytics_result and analytics_result.get('status') == 'success':
             print("   ✅ Success")
             data = analytics_result.get('data', {})